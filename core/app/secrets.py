@@ -6,6 +6,7 @@ import os
 import secrets as pysecrets
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +17,11 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from app.config import CoreSettings
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass(slots=True)
 class SecretStatus:
@@ -114,9 +120,7 @@ class SecretsStore:
 
     def _required_secrets(self, namespace: str) -> list[str]:
         config_path = self._tools_dir / namespace / "tooldock.yaml"
-        if not config_path.exists():
-            return []
-        data = _read_yaml_file(config_path, default={})
+        data = _read_namespace_config(config_path)
         raw = data.get("secrets") or []
         if not isinstance(raw, list):
             return []
@@ -124,9 +128,7 @@ class SecretsStore:
 
     def _namespace_defaults(self, namespace: str) -> dict[str, str]:
         config_path = self._tools_dir / namespace / "tooldock.yaml"
-        if not config_path.exists():
-            return {}
-        data = _read_yaml_file(config_path, default={})
+        data = _read_namespace_config(config_path)
         env = data.get("env") or {}
         if not isinstance(env, dict):
             return {}
@@ -146,7 +148,7 @@ class SecretsStore:
         if not self._settings.allow_insecure_secrets:
             raise RuntimeError("SECRETS_KEY is required unless ALLOW_INSECURE_SECRETS=1")
 
-        data = yaml.safe_load(raw) or {}
+        data = yaml.load(raw, Loader=_YamlLoader) or {}
         if not isinstance(data, dict):
             return {"global": {}, "namespaces": {}}
         return data
@@ -203,12 +205,31 @@ def _derive_fernet_key(password: str, salt: bytes) -> bytes:
 def _read_yaml_file(path: Path, default: Any) -> Any:
     if not path.exists():
         return default
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
     if data is None:
         return default
     return data
 
 
+def _read_namespace_config(path: Path) -> dict[str, Any]:
+    """Read a namespace's tooldock.yaml, reparsing only when the file changes.
+
+    The returned mapping is shared between callers and must not be mutated.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return {}
+    data = _load_yaml_cached(path, stat.st_mtime_ns, stat.st_size)
+    return data if isinstance(data, dict) else {}
+
+
+@lru_cache(maxsize=256)
+def _load_yaml_cached(path: Path, mtime_ns: int, size: int) -> Any:
+    # mtime_ns and size only key the cache so edits invalidate the entry.
+    return _read_yaml_file(path, default={})
+
+
 def _meta_status(entry: Any) -> str:
     if isinstance(entry, dict):
         status = str(entry.get("status", "")).strip()
@@ -7,6 +7,7 @@ import secrets as pysecrets
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +19,11 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from app.config import ManagerSettings
 from app.tools.common import data_paths
 
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 
 @dataclass(slots=True)
 class SecretStatus:
@@ -63,13 +69,13 @@ class ManagerSecretsStore:
         if not self._settings.allow_insecure_secrets:
             raise RuntimeError("SECRETS_KEY is required unless ALLOW_INSECURE_SECRETS=1")
 
-        data = yaml.safe_load(raw) or {}
+        data = yaml.load(raw, Loader=_YamlLoader) or {}
         if not isinstance(data, dict):
             return {"global": {}, "namespaces": {}}
         return data
 
     def save(self, payload: dict[str, Any], meta: dict[str, Any]) -> None:
-        self._meta_path.write_text(yaml.safe_dump(meta, sort_keys=False), encoding="utf-8")
+        self._meta_path.write_text(yaml.dump(meta, Dumper=_YamlDumper, sort_keys=False), encoding="utf-8")
 
         key = self._settings.secrets_key
         if key:
@@ -80,7 +86,7 @@ class ManagerSecretsStore:
         if not self._settings.allow_insecure_secrets:
             raise RuntimeError("SECRETS_KEY is required unless ALLOW_INSECURE_SECRETS=1")
 
-        self._enc_path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
+        self._enc_path.write_text(yaml.dump(payload, Dumper=_YamlDumper, sort_keys=False), encoding="utf-8")
 
     def prepare_secret(self, key: str, namespace: str | None = None) -> dict[str, Any]:
         with self.lock():
@@ -208,9 +214,7 @@ class ManagerSecretsStore:
 
 
 def _required_secrets(path: Path) -> list[str]:
-    if not path.exists():
-        return []
-    data = _read_yaml_file(path, default={})
+    data = _read_namespace_config(path)
     raw = data.get("secrets") or []
     if not isinstance(raw, list):
         return []
@@ -227,10 +231,29 @@ def _ensure_payload_shape(payload: dict[str, Any]) -> None:
     payload.setdefault("namespaces", {})
 
 
+def _read_namespace_config(path: Path) -> dict[str, Any]:
+    """Read a namespace's tooldock.yaml, reparsing only when the file changes.
+
+    The returned mapping is shared between callers and must not be mutated.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return {}
+    data = _load_yaml_cached(path, stat.st_mtime_ns, stat.st_size)
+    return data if isinstance(data, dict) else {}
+
+
+@lru_cache(maxsize=256)
+def _load_yaml_cached(path: Path, mtime_ns: int, size: int) -> Any:
+    # mtime_ns and size only key the cache so edits invalidate the entry.
+    return _read_yaml_file(path, default={})
+
+
 def _read_yaml_file(path: Path, default: Any) -> Any:
     if not path.exists():
         return default
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
     if data is None:
         return default
     return data
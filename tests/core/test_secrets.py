@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tests.helpers import import_core, set_test_env
+
+
+def test_namespace_config_reloads_after_edit(tmp_path: Path, monkeypatch):
+    config = import_core("app.config")
+    set_test_env(monkeypatch, tmp_path)
+
+    secrets = import_core("app.secrets")
+    store = secrets.SecretsStore(config.CoreSettings())
+    store.load()
+
+    ns_dir = tmp_path / "tools" / "github"
+    ns_dir.mkdir(parents=True)
+    config_path = ns_dir / "tooldock.yaml"
+    config_path.write_text("secrets:\n  - GITHUB_TOKEN\nenv:\n  API: v1\n", encoding="utf-8")
+
+    assert store.check_namespace_requirements("github")["missing"] == ["GITHUB_TOKEN"]
+    assert store.get_env("github")["API"] == "v1"
+
+    config_path.write_text("secrets: []\nenv:\n  API: v2-beta\n", encoding="utf-8")
+
+    assert store.check_namespace_requirements("github")["missing"] == []
+    assert store.get_env("github")["API"] == "v2-beta"
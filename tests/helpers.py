@@ -24,6 +24,18 @@ def import_manager(module_name: str):
     return importlib.import_module(module_name)
 
 
+def set_test_env(monkeypatch, data_dir: Path) -> None:
+    """Set the env vars core and manager settings need, rooted at data_dir."""
+    env = {
+        "BEARER_TOKEN": "x",
+        "MANAGER_INTERNAL_TOKEN": "y",
+        "DATA_DIR": str(data_dir),
+        "ALLOW_INSECURE_SECRETS": "1",
+    }
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+
 def _reset_app_modules() -> None:
     for key in list(sys.modules):
         if key == "app" or key.startswith("app."):
@@ -2,42 +2,72 @@ from __future__ import annotations
 
 import asyncio
 import importlib
+import sys
 
-from tests.helpers import import_manager
+import pytest
+
+from tests.helpers import import_manager, set_test_env
+
+_modules = None
+
+# Required arguments of write_tool, as reported by the guide and tools/list.
+WRITE_TOOL_REQUIRED = ["namespace", "filename", "code"]
+
+# Uses a bare @tool decorator without importing or defining it.
+UNBOUND_TOOL_CODE = """@tool
+def ping(name: str) -> str:
+    \"\"\"Test.\"\"\"
+    return name
+"""
 
 
 def _manager_modules():
-    import_manager("app.config")
-    config = importlib.import_module("app.config")
-    methods = importlib.import_module("app.mcp.methods")
-    session = importlib.import_module("app.mcp.session")
-    stream = importlib.import_module("app.mcp.stream")
-    service = importlib.import_module("app.tools.service")
-    return config, methods, session, stream, service
+    # Reuse the imported modules while the manager's `app` package is still the
+    # one in sys.modules; core tests swap it out via import_core().
+    global _modules
+    if _modules is None or sys.modules.get("app.config") is not _modules[0]:
+        import_manager("app.config")
+        _modules = tuple(
+            importlib.import_module(name)
+            for name in (
+                "app.config",
+                "app.mcp.methods",
+                "app.mcp.session",
+                "app.mcp.stream",
+                "app.tools.service",
+            )
+        )
+    return _modules
 
 
 def _service(tmp_path, monkeypatch):
     config, _, _, _, service_mod = _manager_modules()
-    monkeypatch.setenv("BEARER_TOKEN", "x")
-    monkeypatch.setenv("MANAGER_INTERNAL_TOKEN", "y")
-    monkeypatch.setenv("DATA_DIR", str(tmp_path))
-    monkeypatch.setenv("ALLOW_INSECURE_SECRETS", "1")
+    set_test_env(monkeypatch, tmp_path)
     settings = config.ManagerSettings()
     return service_mod.ManagerToolService(settings, started_at=0.0)
 
 
-def _methods(service):
+@pytest.fixture(scope="module")
+def read_only_service(tmp_path_factory):
+    """Service shared by tests that only read tools and never write to DATA_DIR."""
+    with pytest.MonkeyPatch.context() as mp:
+        yield _service(tmp_path_factory.mktemp("manager_data"), mp)
+
+
+@pytest.fixture(scope="module")
+def read_only_methods(read_only_service):
+    """MCP methods and an initialized session over the shared read-only service."""
     _, methods_mod, session_mod, stream_mod, _ = _manager_modules()
     sessions = session_mod.SessionManager(ttl_seconds=60, supported_versions=["2025-11-25"])
     streams = stream_mod.StreamManager()
-    methods = methods_mod.ManagerMcpMethods(service, sessions, streams)
+    methods = methods_mod.ManagerMcpMethods(read_only_service, sessions, streams)
     session = sessions.create("2025-11-25")
     sessions.mark_initialized(session.session_id)
     return methods, session
 
 
-def test_first_call_tool_is_first_and_returns_usage(tmp_path, monkeypatch):
-    service = _service(tmp_path, monkeypatch)
+def test_first_call_tool_is_first_and_returns_usage(read_only_service):
+    service = read_only_service
     descriptors = service.list_tool_descriptors()
 
     assert descriptors[0]["name"] == "a_first_call_instructions"
@@ -51,13 +81,12 @@ def test_first_call_tool_is_first_and_returns_usage(tmp_path, monkeypatch):
     assert "get_tool_template" in tools
     assert tools["create_namespace"]["required_parameters"] == ["name"]
     assert tools["get_tool_template"]["required_parameters"] == []
-    assert tools["write_tool"]["required_parameters"] == ["namespace", "filename", "code"]
+    assert tools["write_tool"]["required_parameters"] == WRITE_TOOL_REQUIRED
     assert "get_tool_template and mirror its structure." in guide["workflow"][2]
 
 
-def test_tools_list_uses_descriptor_input_schema(tmp_path, monkeypatch):
-    service = _service(tmp_path, monkeypatch)
-    methods, session = _methods(service)
+def test_tools_list_uses_descriptor_input_schema(read_only_methods):
+    methods, session = read_only_methods
 
     payload = asyncio.run(methods.dispatch("tools/list", {}, session))
     assert payload is not None
@@ -66,12 +95,12 @@ def test_tools_list_uses_descriptor_input_schema(tmp_path, monkeypatch):
     assert payload["tools"][0]["name"] == "a_first_call_instructions"
     assert tools["create_namespace"]["inputSchema"]["required"] == ["name"]
     assert "required" not in tools["get_tool_template"]["inputSchema"]
-    assert tools["write_tool"]["inputSchema"]["required"] == ["namespace", "filename", "code"]
+    assert tools["write_tool"]["inputSchema"]["required"] == WRITE_TOOL_REQUIRED
     assert "required" not in tools["list_namespaces"]["inputSchema"]
 
 
-def test_get_tool_template_returns_fastmcp_example(tmp_path, monkeypatch):
-    service = _service(tmp_path, monkeypatch)
+def test_get_tool_template_returns_fastmcp_example(read_only_service):
+    service = read_only_service
 
     template = asyncio.run(service.call_tool("get_tool_template", {}))
     assert template["ok"] is True
@@ -82,29 +111,25 @@ def test_get_tool_template_returns_fastmcp_example(tmp_path, monkeypatch):
 
 def test_write_tool_rejects_unbound_bare_tool_decorator(tmp_path, monkeypatch):
     service = _service(tmp_path, monkeypatch)
-    asyncio.run(service.call_tool("create_namespace", {"name": "demo"}))
-    code = """@tool
-def ping(name: str) -> str:
-    \"\"\"Test.\"\"\"
-    return name
-"""
-    result = asyncio.run(
-        service.call_tool(
+
+    async def create_and_write():
+        await service.call_tool("create_namespace", {"name": "demo"})
+        return await service.call_tool(
             "write_tool",
             {
                 "namespace": "demo",
                 "filename": "bad_tool.py",
-                "code": code,
+                "code": UNBOUND_TOOL_CODE,
             },
         )
-    )
+
+    result = asyncio.run(create_and_write())
     assert result["written"] is False
     assert result["error"] == "Bare @tool decorator is not defined in this file"
 
 
-def test_tools_call_list_result_has_no_structured_content(tmp_path, monkeypatch):
-    service = _service(tmp_path, monkeypatch)
-    methods, session = _methods(service)
+def test_tools_call_list_result_has_no_structured_content(read_only_methods):
+    methods, session = read_only_methods
 
     payload = asyncio.run(
         methods.dispatch("tools/call", {"name": "list_namespaces", "arguments": {}}, session)
@@ -115,9 +140,8 @@ def test_tools_call_list_result_has_no_structured_content(tmp_path, monkeypatch)
     assert payload["content"][0]["text"] == "[]"
 
 
-def test_tools_call_missing_required_argument_returns_explicit_error(tmp_path, monkeypatch):
-    service = _service(tmp_path, monkeypatch)
-    methods, session = _methods(service)
+def test_tools_call_missing_required_argument_returns_explicit_error(read_only_methods):
+    methods, session = read_only_methods
 
     payload = asyncio.run(
         methods.dispatch("tools/call", {"name": "list_tools", "arguments": {}}, session)
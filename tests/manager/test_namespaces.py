@@ -1,14 +1,11 @@
 from __future__ import annotations
 
-from tests.helpers import import_manager
+from tests.helpers import import_manager, set_test_env
 
 
 def test_create_and_list_namespace(tmp_path, monkeypatch):
     config = import_manager("app.config")
-    monkeypatch.setenv("BEARER_TOKEN", "x")
-    monkeypatch.setenv("MANAGER_INTERNAL_TOKEN", "y")
-    monkeypatch.setenv("DATA_DIR", str(tmp_path))
-    monkeypatch.setenv("ALLOW_INSECURE_SECRETS", "1")
+    set_test_env(monkeypatch, tmp_path)
 
     settings = config.ManagerSettings()
     namespaces_mod = import_manager("app.tools.namespaces")
@@ -18,4 +15,4 @@ def test_create_and_list_namespace(tmp_path, monkeypatch):
     assert created["created"] is True
 
     listed = tool.list_namespaces()
-    assert any(item["name"] == "github" for item in listed)
+    assert "github" in {item["name"] for item in listed}
@@ -1,14 +1,11 @@
 from __future__ import annotations
 
-from tests.helpers import import_manager
+from tests.helpers import import_manager, set_test_env
 
 
 def test_prepare_set_and_check_secret(tmp_path, monkeypatch):
     config = import_manager("app.config")
-    monkeypatch.setenv("BEARER_TOKEN", "x")
-    monkeypatch.setenv("MANAGER_INTERNAL_TOKEN", "y")
-    monkeypatch.setenv("DATA_DIR", str(tmp_path))
-    monkeypatch.setenv("ALLOW_INSECURE_SECRETS", "1")
+    set_test_env(monkeypatch, tmp_path)
 
     settings = config.ManagerSettings()
 
@@ -31,3 +28,23 @@ def test_prepare_set_and_check_secret(tmp_path, monkeypatch):
 
     check2 = store.check_namespace("github")
     assert check2["satisfied"] == ["GITHUB_TOKEN"]
+
+
+def test_check_namespace_rereads_edited_tooldock_yaml(tmp_path, monkeypatch):
+    config = import_manager("app.config")
+    set_test_env(monkeypatch, tmp_path)
+
+    store_mod = import_manager("app.tools.secrets_store")
+    store = store_mod.ManagerSecretsStore(config.ManagerSettings())
+
+    ns_dir = tmp_path / "tools" / "github"
+    ns_dir.mkdir(parents=True)
+    config_path = ns_dir / "tooldock.yaml"
+    config_path.write_text("secrets:\n  - GITHUB_TOKEN\n", encoding="utf-8")
+
+    assert store.check_namespace("github")["missing"] == ["GITHUB_TOKEN"]
+    assert store.check_namespace("github")["missing"] == ["GITHUB_TOKEN"]
+
+    config_path.write_text("secrets:\n  - GITHUB_TOKEN\n  - API_KEY\n", encoding="utf-8")
+
+    assert store.check_namespace("github")["missing"] == ["GITHUB_TOKEN", "API_KEY"]
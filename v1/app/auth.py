@@ -69,7 +69,8 @@ async def verify_token(authorization: Optional[str] = Header(None)) -> str:
 
     Returns the token if valid, raises HTTPException if invalid.
     """
-    if not is_auth_enabled():
+    expected = get_bearer_token()
+    if expected is None:
         return ""
 
     if not authorization:
@@ -86,17 +87,14 @@ async def verify_token(authorization: Optional[str] = Header(None)) -> str:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    provided = authorization.split(" ", 1)[1].strip()
-    expected = get_bearer_token()
-
-    if not expected or not _constant_time_compare(provided, expected):
+    if not _bearer_header_matches(authorization, expected):
         raise HTTPException(
             status_code=401,
             detail="Invalid token",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return provided
+    return authorization.split(" ", 1)[1].strip()
 
 
 def _extract_bearer(header_value: str) -> Optional[str]:
@@ -111,6 +109,21 @@ def _extract_bearer(header_value: str) -> Optional[str]:
     return parts[1].strip() or None
 
 
+def _bearer_header_matches(header_value: str, token: str) -> bool:
+    """
+    Check an Authorization header against the expected bearer token.
+
+    The canonical ``Bearer <token>`` form is matched with a single
+    constant-time comparison of the whole header; other spellings
+    (lowercase scheme, extra whitespace) fall back to parsing.
+    """
+    expected = b"Bearer " + token.encode("utf-8")
+    if hmac.compare_digest(header_value.encode("utf-8"), expected):
+        return True
+    provided = _extract_bearer(header_value)
+    return provided is not None and _constant_time_compare(provided, token)
+
+
 # ==================== HTTP Basic Auth ====================
 
 async def verify_basic_auth(
@@ -124,10 +137,9 @@ async def verify_basic_auth(
 
     Returns the username if valid, raises HTTPException if invalid.
     """
-    if not is_auth_enabled():
-        return "anonymous"
-
     expected_password = get_bearer_token()
+    if expected_password is None:
+        return "anonymous"
 
     if not credentials:
         raise HTTPException(
@@ -138,7 +150,7 @@ async def verify_basic_auth(
 
     # Constant-time comparison for both username and password
     username_valid = _constant_time_compare(credentials.username, ADMIN_USERNAME)
-    password_valid = _constant_time_compare(credentials.password, expected_password or "")
+    password_valid = _constant_time_compare(credentials.password, expected_password)
 
     if not (username_valid and password_valid):
         raise HTTPException(
@@ -164,21 +176,18 @@ async def verify_token_or_basic(
 
     Returns the authenticated identity (token or username).
     """
-    if not is_auth_enabled():
-        return "anonymous"
-
     expected_token = get_bearer_token()
+    if expected_token is None:
+        return "anonymous"
 
     # Try Bearer token first
-    if authorization and authorization.lower().startswith("bearer "):
-        provided = authorization.split(" ", 1)[1].strip()
-        if expected_token and _constant_time_compare(provided, expected_token):
-            return "bearer-auth"
+    if authorization and _bearer_header_matches(authorization, expected_token):
+        return "bearer-auth"
 
     # Try Basic auth
     if credentials:
         username_valid = _constant_time_compare(credentials.username, ADMIN_USERNAME)
-        password_valid = _constant_time_compare(credentials.password, expected_token or "")
+        password_valid = _constant_time_compare(credentials.password, expected_token)
         if username_valid and password_valid:
             return credentials.username
 
@@ -204,35 +213,31 @@ class BearerAuthMiddleware:
     def __init__(self, app, public_paths: Optional[Set[str]] = None):
         self.app = app
         self.public_paths = public_paths or set()
+        # Exact matches are also prefix matches, so one str.startswith(tuple)
+        # call covers both checks
+        self._public_prefixes = tuple(self.public_paths)
 
     async def __call__(self, scope, receive, send):
         if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
-        request = Request(scope, receive)
         # Skip auth if disabled
-        if not is_auth_enabled():
+        token = get_bearer_token()
+        if token is None:
             await self.app(scope, receive, send)
             return
 
-        # Allow public paths
-        if request.url.path in self.public_paths:
+        request = Request(scope, receive)
+        # Allow public paths, including paths below them (for path params)
+        if request.url.path.startswith(self._public_prefixes):
             await self.app(scope, receive, send)
             return
 
-        # Also allow paths that start with any public path (for path params)
-        for public_path in self.public_paths:
-            if request.url.path.startswith(public_path):
-                await self.app(scope, receive, send)
-                return
-
-        token = get_bearer_token()
         auth_header = request.headers.get("authorization", "")
-        provided = _extract_bearer(auth_header)
 
         # Use constant-time comparison
-        if not provided or not token or not _constant_time_compare(provided, token):
+        if not _bearer_header_matches(auth_header, token):
             response = Response(
                 content="Unauthorized",
                 status_code=401,
@@ -266,39 +271,36 @@ class BasicAuthMiddleware:
         self.public_paths = public_paths or set()
         # Paths that also accept Bearer token (in addition to Basic)
         self.bearer_paths = bearer_paths or {"/api/"}
+        self._public_prefixes = tuple(self.public_paths)
+        self._bearer_prefixes = tuple(self.bearer_paths)
 
     async def __call__(self, scope, receive, send):
         if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
-        request = Request(scope, receive)
         # Skip auth if disabled
-        if not is_auth_enabled():
+        expected_token = get_bearer_token()
+        if expected_token is None:
             await self.app(scope, receive, send)
             return
 
+        request = Request(scope, receive)
         # Allow public paths
         path = request.url.path
-        if path in self.public_paths:
+        if path.startswith(self._public_prefixes):
             await self.app(scope, receive, send)
             return
 
-        for public_path in self.public_paths:
-            if path.startswith(public_path):
-                await self.app(scope, receive, send)
-                return
-
         auth_header = request.headers.get("authorization", "")
-        expected_token = get_bearer_token()
 
         # Check if this path allows Bearer token
-        allows_bearer = any(path.startswith(bp) for bp in self.bearer_paths)
+        allows_bearer = path.startswith(self._bearer_prefixes)
 
         # Try Bearer token first for API paths
         if allows_bearer and auth_header.lower().startswith("bearer "):
             provided = _extract_bearer(auth_header)
-            if provided and expected_token and _constant_time_compare(provided, expected_token):
+            if provided and _constant_time_compare(provided, expected_token):
                 await self.app(scope, receive, send)
                 return
             # Invalid bearer token
@@ -347,7 +349,7 @@ class BasicAuthMiddleware:
 
         # Constant-time comparison
         username_valid = _constant_time_compare(username, ADMIN_USERNAME)
-        password_valid = _constant_time_compare(password, expected_token or "")
+        password_valid = _constant_time_compare(password, expected_token)
 
         if not (username_valid and password_valid):
             response = Response(
@@ -13,6 +13,7 @@ import shutil
 import subprocess
 import sys
 import sysconfig
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -28,8 +29,14 @@ def _get_data_dir() -> Path:
     return Path(data_dir)
 
 
+@lru_cache(maxsize=8)
+def _venvs_root(data_dir: str) -> Path:
+    # Keyed on the DATA_DIR value so runtime changes still take effect
+    return Path(data_dir) / "venvs"
+
+
 def get_venv_dir(namespace: str) -> Path:
-    return _get_data_dir() / "venvs" / namespace
+    return _venvs_root(str(_get_data_dir())) / namespace
 
 
 def get_requirements_path(namespace: str) -> Path:
@@ -92,6 +99,23 @@ def _venv_python(venv_dir: Path) -> Path:
     return venv_dir / "bin" / "python"
 
 
+def _output_tail(data: bytes, limit: int = 4000) -> str:
+    # Decode only the tail we return; pip output can run to megabytes
+    return data[-4 * limit:].decode("utf-8", errors="replace")[-limit:]
+
+
+def _run_pip(cmd: List[str]) -> Dict[str, Any]:
+    """
+    Run a pip command and return its status and the tail of its output.
+    """
+    result = subprocess.run(cmd, check=False, capture_output=True)
+    return {
+        "success": result.returncode == 0,
+        "stdout": _output_tail(result.stdout),
+        "stderr": _output_tail(result.stderr),
+    }
+
+
 def install_packages(namespace: str, packages: List[str]) -> Dict[str, Any]:
     """
     Install pip packages into the namespace venv.
@@ -105,12 +129,7 @@ def install_packages(namespace: str, packages: List[str]) -> Dict[str, Any]:
 
     venv_dir = ensure_venv(namespace)
     cmd = [str(_venv_python(venv_dir)), "-m", "pip", "install"] + packages
-    result = subprocess.run(cmd, check=False, capture_output=True, text=True)
-    return {
-        "success": result.returncode == 0,
-        "stdout": result.stdout[-4000:],
-        "stderr": result.stderr[-4000:],
-    }
+    return _run_pip(cmd)
 
 
 def install_requirements(namespace: str, requirements_text: str) -> Dict[str, Any]:
@@ -122,12 +141,7 @@ def install_requirements(namespace: str, requirements_text: str) -> Dict[str, An
     req_path.write_text(requirements_text, encoding="utf-8")
 
     cmd = [str(_venv_python(venv_dir)), "-m", "pip", "install", "-r", str(req_path)]
-    result = subprocess.run(cmd, check=False, capture_output=True, text=True)
-    return {
-        "success": result.returncode == 0,
-        "stdout": result.stdout[-4000:],
-        "stderr": result.stderr[-4000:],
-    }
+    return _run_pip(cmd)
 
 
 def uninstall_packages(namespace: str, packages: List[str]) -> Dict[str, Any]:
@@ -148,12 +162,7 @@ def uninstall_packages(namespace: str, packages: List[str]) -> Dict[str, Any]:
 
     venv_dir = ensure_venv(namespace)
     cmd = [str(_venv_python(venv_dir)), "-m", "pip", "uninstall", "-y"] + normalized
-    result = subprocess.run(cmd, check=False, capture_output=True, text=True)
-    return {
-        "success": result.returncode == 0,
-        "stdout": result.stdout[-4000:],
-        "stderr": result.stderr[-4000:],
-    }
+    return _run_pip(cmd)
 
 
 def list_packages(namespace: str) -> List[Dict[str, str]]:
@@ -305,6 +305,26 @@ class ToolRegistry:
             return True
         return False
 
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Capture the current tool tables for a later ``restore()``.
+
+        Tool definitions and external tool entries are shared, not copied.
+        """
+        return {
+            "tools": dict(self._tools),
+            "external_tools": dict(self._external_tools),
+            "namespaces": {ns: set(names) for ns, names in self._namespaces.items()},
+            "tool_namespaces": dict(self._tool_namespaces),
+        }
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """Reset the registry in place to a state captured by ``snapshot()``."""
+        self._tools = dict(snapshot["tools"])
+        self._external_tools = dict(snapshot["external_tools"])
+        self._namespaces = {ns: set(names) for ns, names in snapshot["namespaces"].items()}
+        self._tool_namespaces = dict(snapshot["tool_namespaces"])
+
     def unregister_external_server(self, server_id: str) -> int:
         """
         Remove all external tools belonging to a server.
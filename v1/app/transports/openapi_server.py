@@ -21,16 +21,17 @@ Usage:
 from __future__ import annotations
 
 import os
+import json
 import logging
 import asyncio
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from fastapi import FastAPI, HTTPException, Body, Depends, Request
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from app.auth import get_bearer_token, is_auth_enabled, _constant_time_compare
+from app.auth import get_bearer_token, _bearer_header_matches
 from app.middleware import TrailingNewlineMiddleware, RequestLoggingMiddleware
 from app.metrics_store import init_metrics_store
 from app.registry import ToolRegistry
@@ -51,15 +52,46 @@ RESERVED_PREFIXES = {
 
 async def bearer_auth_dependency(request: Request) -> None:
     """Validate Bearer token authentication."""
-    if not is_auth_enabled():
-        return
     token = get_bearer_token()
+    if token is None:
+        return
     header = request.headers.get("authorization", "")
+    if _bearer_header_matches(header, token):
+        return
     if not header.lower().startswith("bearer "):
         raise ToolUnauthorizedError("Authorization Header fehlt oder ist ungültig")
-    provided = header.split(" ", 1)[1].strip()
-    if not token or not _constant_time_compare(provided, token):
-        raise ToolUnauthorizedError("Bearer Token ist ungültig")
+    raise ToolUnauthorizedError("Bearer Token ist ungültig")
+
+
+async def _read_json_payload(request: Request) -> Dict[str, Any]:
+    """Parse the request body as a JSON object.
+
+    Tool input models validate the arguments in ``registry.call``, so the
+    tool-call endpoints read the body directly instead of running it through
+    FastAPI's generic ``Dict[str, Any]`` body validation first. Malformed
+    bodies get the same ToolValidationError envelope on every route.
+    """
+    body = await request.body()
+    if not body:
+        return {}
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise ToolValidationError("Request-Body ist kein gültiges JSON")
+    if payload is None:
+        return {}
+    if not isinstance(payload, dict):
+        raise ToolValidationError("Request-Body muss ein JSON-Objekt sein")
+    return payload
+
+
+# OpenAPI request body for routes that parse it via _read_json_payload.
+_ANY_OBJECT_BODY = {
+    "requestBody": {
+        "required": False,
+        "content": {"application/json": {"schema": {"type": "object"}}},
+    },
+}
 
 
 def _resolve_tool_name(registry: ToolRegistry, name: str) -> Optional[str]:
@@ -291,10 +323,11 @@ def create_openapi_app(
     # Register native tool endpoints
     def make_endpoint(tool_name: str):
         async def endpoint(
-            payload: Dict[str, Any] = Body(default={}),
+            request: Request,
             _auth: Any = Depends(bearer_auth_dependency),
         ):
-            result = await app.state.registry.call(tool_name, payload or {})
+            payload = await _read_json_payload(request)
+            result = await app.state.registry.call(tool_name, payload)
             return {"tool": tool_name, "result": result}
 
         endpoint.__name__ = f"tool_{REGISTRY_NAMESPACE}_{tool_name}"
@@ -333,12 +366,11 @@ def create_openapi_app(
             200: {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/ToolResult"}}}},
             401: {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/ToolError"}}}},
             404: {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/ToolError"}}}},
+            422: {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/ToolError"}}}},
         },
+        openapi_extra=_ANY_OBJECT_BODY,
     )
-    async def call_tool_dynamic(
-        tool_name: str,
-        payload: Dict[str, Any] = Body(default={}),
-    ):
+    async def call_tool_dynamic(tool_name: str, request: Request):
         """Execute any tool by name (supports external tools with prefixed names).
 
         Resolution order when the exact name isn't found:
@@ -346,10 +378,11 @@ def create_openapi_app(
         2. Match by suffix (``install_x`` → ``ns:install_x``) for when
            LLMs drop the namespace prefix from namespaced tool names.
         """
+        payload = await _read_json_payload(request)
         resolved = _resolve_tool_name(registry, tool_name)
         if not resolved:
             raise HTTPException(status_code=404, detail=f"Tool not found: {tool_name}")
-        result = await registry.call(resolved, payload or {})
+        result = await registry.call(resolved, payload)
         return {"tool": resolved, "result": result}
 
     # ==================== Namespace-Scoped Routes: /{namespace}/openapi/* ====================
@@ -421,14 +454,13 @@ def create_openapi_app(
             200: {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/ToolResult"}}}},
             401: {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/ToolError"}}}},
             404: {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/ToolError"}}}},
+            422: {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/ToolError"}}}},
         },
+        openapi_extra=_ANY_OBJECT_BODY,
     )
-    async def ns_openapi_call_tool(
-        namespace: str,
-        tool_name: str,
-        payload: Dict[str, Any] = Body(default={}),
-    ):
+    async def ns_openapi_call_tool(namespace: str, tool_name: str, request: Request):
         """Execute a tool within a specific namespace."""
+        payload = await _read_json_payload(request)
         _validate_ns_param(namespace)
         if not registry.has_namespace(namespace):
             raise HTTPException(
@@ -445,7 +477,7 @@ def create_openapi_app(
                 status_code=404,
                 detail=f"Tool '{resolved}' not found in namespace '{namespace}'",
             )
-        result = await registry.call(resolved, payload or {})
+        result = await registry.call(resolved, payload)
         return {"tool": resolved, "result": result}
 
     # ==================== Admin + Reloader ====================
@@ -783,7 +783,8 @@ async def delete_fastmcp_server(server_id: int, _: str = Depends(verify_token))
         raise HTTPException(status_code=500, detail="FastMCP manager not initialized")
 
     try:
-        _fastmcp_manager.delete_server(server_id)
+        # delete_server removes the namespace venv; keep the rmtree off the event loop
+        await asyncio.to_thread(_fastmcp_manager.delete_server, server_id)
     except Exception as exc:
         message = str(exc)
         if "protected system server" in message:
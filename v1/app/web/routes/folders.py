@@ -10,6 +10,7 @@ Security:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import re
@@ -236,7 +237,7 @@ async def create_folder(
         except Exception:
             logger.warning(f"Failed to rollback folder after create error: {folder_path}", exc_info=True)
         try:
-            delete_venv(request.name)
+            await asyncio.to_thread(delete_venv, request.name)
         except Exception:
             logger.warning(f"Failed to rollback venv after create error: {request.name}", exc_info=True)
         logger.error(f"Failed to create folder {request.name}", exc_info=True)
@@ -284,8 +285,8 @@ async def delete_folder(
 
     try:
         _safe_rmtree(folder_path, _get_base_tools_dir())
-        # Remove namespace venv on folder deletion
-        delete_venv(namespace)
+        # Remove namespace venv on folder deletion (off the event loop)
+        await asyncio.to_thread(delete_venv, namespace)
         logger.info(f"Deleted folder: {folder_path}")
 
         return {
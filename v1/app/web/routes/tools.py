@@ -11,6 +11,7 @@ Security:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import re
@@ -201,7 +202,8 @@ async def delete_dependencies_env(
     Delete the namespace venv.
     """
     _ = _get_tools_dir(namespace)  # Validate namespace
-    deleted = delete_venv(namespace)
+    # Removing a venv unlinks thousands of files; keep it off the event loop
+    deleted = await asyncio.to_thread(delete_venv, namespace)
     return {"success": True, "deleted": deleted}
 
 
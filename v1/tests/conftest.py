@@ -5,9 +5,11 @@ Shared pytest fixtures for ToolDock tests.
 from __future__ import annotations
 
 import os
+import shutil
 import sys
 from pathlib import Path
-from typing import Generator
+from types import MappingProxyType
+from typing import Generator, Mapping
 
 import pytest
 
@@ -66,16 +68,16 @@ def registry_with_tools(registry: ToolRegistry) -> ToolRegistry:
 # ==================== Auth Fixtures ====================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_token() -> str:
     """Test authentication token."""
     return "test_secret_token_12345"
 
 
-@pytest.fixture
-def auth_headers(auth_token: str) -> dict:
-    """Authorization headers with test bearer token."""
-    return {"Authorization": f"Bearer {auth_token}"}
+@pytest.fixture(scope="session")
+def auth_headers(auth_token: str) -> Mapping[str, str]:
+    """Read-only authorization headers with test bearer token."""
+    return MappingProxyType({"Authorization": f"Bearer {auth_token}"})
 
 
 @pytest.fixture
@@ -227,28 +229,47 @@ def clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.delenv(var, raising=False)
 
 
-@pytest.fixture
-def data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+@pytest.fixture(scope="session")
+def data_dir_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
-    Temporary data directory for tests.
-
-    Creates the expected subdirectory structure.
+    Data directory skeleton with an initialized database, built once per session.
     """
-    data = tmp_path / "tooldock_data"
+    from app.db.database import reset_engine, init_db
+
+    data = tmp_path_factory.mktemp("template") / "tooldock_data"
     (data / "tools" / "shared").mkdir(parents=True)
     (data / "external").mkdir(parents=True)
     (data / "config").mkdir(parents=True)
     (data / "db").mkdir(parents=True)
 
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATA_DIR", str(data))
+        reset_engine()
+        init_db()
+        reset_engine()
+
+    return data
+
+
+@pytest.fixture
+def data_dir(
+    data_dir_template: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """
+    Temporary data directory for tests.
+
+    Copies the session template, so each test gets the expected
+    subdirectory structure and database tables without re-creating them.
+    """
+    data = tmp_path / "tooldock_data"
+    shutil.copytree(data_dir_template, data)
+
     monkeypatch.setenv("DATA_DIR", str(data))
 
     # Reset database engine to use new DATA_DIR
-    from app.db.database import reset_engine, init_db
+    from app.db.database import reset_engine
     reset_engine()
 
-    # Initialize database tables
-    init_db()
-
     yield data
 
     # Clean up after test
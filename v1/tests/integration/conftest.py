@@ -0,0 +1,72 @@
+"""
+Shared fixtures for integration tests.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+import pytest
+
+from app.registry import ToolRegistry
+from tests.utils.sync_client import SyncASGIClient
+
+
+# ==================== Auth Fixtures ====================
+
+
+@pytest.fixture(scope="session")
+def auth_token() -> str:
+    """Bearer token used by all integration apps."""
+    return "test_token"
+
+
+@pytest.fixture(scope="session")
+def auth_headers(auth_token: str) -> Mapping[str, str]:
+    """Read-only bearer auth headers, built once per session."""
+    return MappingProxyType({"Authorization": f"Bearer {auth_token}"})
+
+
+@pytest.fixture(scope="package", autouse=True)
+def _bearer_token_env(auth_token: str):
+    """
+    Enable auth for every integration test.
+
+    Set once for the package instead of per client fixture; tests that
+    need auth disabled still ``monkeypatch.delenv`` it locally.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("BEARER_TOKEN", auth_token)
+        yield
+
+
+# ==================== Client Fixtures ====================
+
+
+@pytest.fixture(scope="module")
+def web_app(tmp_path_factory: pytest.TempPathFactory):
+    """
+    Web app over an empty registry, built once per module.
+
+    Routes resolve DATA_DIR and the database per request, so one app
+    serves every test; ``web_client`` supplies the per-test data dir.
+    """
+    from app.web.server import create_web_app
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATA_DIR", str(tmp_path_factory.mktemp("web_app_data")))
+        yield create_web_app(ToolRegistry())
+
+
+@pytest.fixture
+def web_client(web_app, data_dir: Path):
+    """
+    TestClient for Web GUI endpoints, sharing the module's web app.
+    """
+    client = SyncASGIClient(web_app)
+    try:
+        yield client
+    finally:
+        client.close()
@@ -8,6 +8,8 @@ Tests:
 - Tool content update (PUT)
 """
 
+from typing import Mapping
+
 import pytest
 
 from tests.utils.sync_client import SyncASGIClient
@@ -22,7 +24,7 @@ class TestAdminHealth:
         assert response.status_code == 401
 
     def test_health_returns_services(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Health endpoint returns service statuses."""
         response = web_client.get("/api/admin/health", headers=auth_headers)
@@ -35,7 +37,7 @@ class TestAdminHealth:
         assert isinstance(data["services"], list)
 
     def test_health_includes_web_service(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Health includes web service which is always healthy."""
         response = web_client.get("/api/admin/health", headers=auth_headers)
@@ -57,7 +59,7 @@ class TestAdminLogs:
         assert response.status_code == 401
 
     def test_logs_returns_entries(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Logs endpoint returns log entries."""
         response = web_client.get("/api/admin/logs", headers=auth_headers)
@@ -70,7 +72,7 @@ class TestAdminLogs:
         assert isinstance(data["logs"], list)
 
     def test_logs_respects_limit(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Logs endpoint respects limit parameter."""
         response = web_client.get(
@@ -82,7 +84,7 @@ class TestAdminLogs:
         assert len(data["logs"]) <= 5
 
     def test_logs_filters_by_level(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Logs endpoint filters by level."""
         response = web_client.get(
@@ -105,7 +107,7 @@ class TestAdminInfo:
         assert response.status_code == 401
 
     def test_info_returns_system_info(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Info endpoint returns system information."""
         response = web_client.get("/api/admin/info", headers=auth_headers)
@@ -122,7 +124,7 @@ class TestAdminInfo:
         assert "host_data_dir" in data["environment"]
 
     def test_info_includes_namespaces(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Info endpoint includes namespace list."""
         response = web_client.get("/api/admin/info", headers=auth_headers)
@@ -143,7 +145,7 @@ class TestToolUpdate:
         assert response.status_code == 401
 
     def test_update_nonexistent_tool(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Update returns 404 for nonexistent tool."""
         response = web_client.put(
@@ -154,7 +156,7 @@ class TestToolUpdate:
         assert response.status_code == 404
 
     def test_update_invalid_namespace(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Update returns 400 or 404 for invalid namespace."""
         response = web_client.put(
@@ -166,7 +168,7 @@ class TestToolUpdate:
         assert response.status_code in [400, 404]
 
     def test_update_requires_valid_json(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Update endpoint requires valid JSON body."""
         # Test with invalid JSON format
@@ -189,7 +191,7 @@ class TestLogFiles:
         assert response.status_code == 401
 
     def test_list_log_files_returns_info(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Log files listing returns file information."""
         response = web_client.get("/api/admin/logs/files", headers=auth_headers)
@@ -209,7 +211,7 @@ class TestLogFiles:
         assert response.status_code == 401
 
     def test_get_log_file_not_found(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Nonexistent log file returns 404."""
         response = web_client.get(
@@ -227,7 +229,7 @@ class TestNamespaces:
         assert response.status_code == 401
 
     def test_namespaces_returns_list(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Namespaces endpoint returns unified namespace list."""
         response = web_client.get("/api/admin/namespaces", headers=auth_headers)
@@ -240,7 +242,7 @@ class TestNamespaces:
         assert data["total"] == len(data["namespaces"])
 
     def test_namespaces_include_type(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Namespaces include type field (native, fastmcp, external)."""
         response = web_client.get("/api/admin/namespaces", headers=auth_headers)
@@ -253,7 +255,7 @@ class TestNamespaces:
             assert "tool_count" in ns
 
     def test_namespaces_include_endpoint(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Namespaces include endpoint field."""
         response = web_client.get("/api/admin/namespaces", headers=auth_headers)
@@ -272,7 +274,7 @@ class TestMetrics:
         assert response.status_code == 401
 
     def test_metrics_returns_structure(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         response = web_client.get("/api/admin/metrics", headers=auth_headers)
         assert response.status_code == 200
@@ -288,7 +290,7 @@ class TestSecurityHeaders:
     """Tests for security-related behavior."""
 
     def test_path_traversal_blocked(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Path traversal attempts are blocked."""
         # Try various path traversal patterns
@@ -308,7 +310,7 @@ class TestSecurityHeaders:
             assert response.status_code in [400, 404], f"Pattern {pattern} was not blocked"
 
     def test_invalid_filename_blocked(
-        self, web_client: SyncASGIClient, auth_headers: dict
+        self, web_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Invalid filenames are blocked."""
         # Note: Null bytes (\x00) cannot be tested because httpx rejects them at URL level
@@ -6,6 +6,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+from types import MappingProxyType
+from typing import Mapping
 
 import anyio
 import httpx
@@ -17,6 +19,24 @@ from app.transports.mcp_http_server import create_mcp_http_app
 from tests.utils.sync_client import SyncASGIClient
 
 
+class GreetInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    name: str = Field(default="World", description="Name to greet")
+
+
+async def greet_handler(payload: GreetInput) -> str:
+    return f"Hello, {payload.name}!"
+
+
+class TeamInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    value: int = Field(default=1, description="A number")
+
+
+async def team_handler(payload: TeamInput) -> int:
+    return payload.value * 10
+
+
 # ==================== Fixtures ====================
 
 
@@ -27,14 +47,6 @@ def registry() -> ToolRegistry:
     reg = ToolRegistry()
 
     # Tool in 'shared' namespace
-    class GreetInput(BaseModel):
-        model_config = ConfigDict(extra="forbid")
-        name: str = Field(default="World", description="Name to greet")
-
-    async def greet_handler(payload: GreetInput) -> str:
-        return f"Hello, {payload.name}!"
-
-    GreetInput.model_rebuild(force=True)
     reg.register(
         ToolDefinition(
             name="greet",
@@ -46,14 +58,6 @@ def registry() -> ToolRegistry:
     )
 
     # Tool in 'team' namespace
-    class TeamInput(BaseModel):
-        model_config = ConfigDict(extra="forbid")
-        value: int = Field(default=1, description="A number")
-
-    async def team_handler(payload: TeamInput) -> int:
-        return payload.value * 10
-
-    TeamInput.model_rebuild(force=True)
     reg.register(
         ToolDefinition(
             name="multiply_ten",
@@ -69,9 +73,8 @@ def registry() -> ToolRegistry:
 
 
 @pytest.fixture
-def client(registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch) -> SyncASGIClient:
+def client(registry: ToolRegistry) -> SyncASGIClient:
     """Test client with auth enabled."""
-    monkeypatch.setenv("BEARER_TOKEN", "test_token")
     app = create_mcp_http_app(registry)
     client = SyncASGIClient(app)
     try:
@@ -80,13 +83,13 @@ def client(registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch) -> SyncASGIC
         client.close()
 
 
-@pytest.fixture
-def auth_headers() -> dict:
+@pytest.fixture(scope="session")
+def auth_headers() -> Mapping[str, str]:
     """Auth headers for requests."""
-    return {
+    return MappingProxyType({
         "Authorization": "Bearer test_token",
         "Accept": "application/json, text/event-stream",
-    }
+    })
 
 
 # ==================== Health Endpoint Tests ====================
@@ -112,7 +115,7 @@ class TestHealthEndpoint:
         assert "tools" in data
         assert data["tools"]["total"] >= 2
 
-    def test_get_mcp_stream(self, client: SyncASGIClient, auth_headers: dict):
+    def test_get_mcp_stream(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """GET /mcp returns SSE stream when Accept is correct."""
         response = client.get(
             "/mcp",
@@ -121,7 +124,7 @@ class TestHealthEndpoint:
         assert response.status_code == 200
         assert "text/event-stream" in response.headers.get("content-type", "")
 
-    def test_get_mcp_stream_alias(self, client: SyncASGIClient, auth_headers: dict):
+    def test_get_mcp_stream_alias(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """GET /mcp/sse returns SSE stream for compatibility with some clients."""
         response = client.get(
             "/mcp/sse",
@@ -130,7 +133,7 @@ class TestHealthEndpoint:
         assert response.status_code == 200
         assert "text/event-stream" in response.headers.get("content-type", "")
 
-    def test_get_mcp_namespace_stream(self, client: SyncASGIClient, auth_headers: dict):
+    def test_get_mcp_namespace_stream(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """GET /{namespace}/mcp returns SSE stream when Accept is correct."""
         response = client.get(
             "/shared/mcp",
@@ -139,7 +142,7 @@ class TestHealthEndpoint:
         assert response.status_code == 200
         assert "text/event-stream" in response.headers.get("content-type", "")
 
-    def test_get_mcp_namespace_stream_alias(self, client: SyncASGIClient, auth_headers: dict):
+    def test_get_mcp_namespace_stream_alias(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """GET /{namespace}/mcp/sse returns SSE stream for compatibility with some clients."""
         response = client.get(
             "/shared/mcp/sse",
@@ -156,7 +159,7 @@ class TestMCPInitialize:
     """Tests for MCP initialize method."""
 
     def test_initialize_global_endpoint(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test initialize on global /mcp endpoint."""
         response = client.post(
@@ -184,7 +187,7 @@ class TestMCPInitialize:
         assert response.headers.get("Mcp-Session-Id")
 
     def test_initialize_accept_text_event_stream_returns_sse(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """POST should still work when client sends Accept: text/event-stream."""
         response = client.post(
@@ -211,7 +214,7 @@ class TestMCPInitialize:
         assert data["result"]["protocolVersion"] == "2024-11-05"
 
     def test_initialize_protocol_header_2024_is_accepted(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Header MCP-Protocol-Version=2024-11-05 should not be rejected."""
         response = client.post(
@@ -233,7 +236,7 @@ class TestMCPInitialize:
         assert data["result"]["protocolVersion"] == "2024-11-05"
 
     def test_initialize_unknown_protocol_header_is_ignored(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Unknown MCP-Protocol-Version header should not hard-fail the request."""
         response = client.post(
@@ -254,7 +257,7 @@ class TestMCPInitialize:
         data = response.json()
         assert "result" in data
 
-    def test_initialize_missing_accept_header(self, client: SyncASGIClient, auth_headers: dict):
+    def test_initialize_missing_accept_header(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Missing Accept header is accepted for JSON-RPC POST compatibility."""
         headers = dict(auth_headers)
         headers.pop("Accept", None)
@@ -271,7 +274,7 @@ class TestMCPInitialize:
         assert response.status_code == 200
 
     def test_initialize_explicit_incompatible_accept_rejected(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Explicitly incompatible Accept header is rejected."""
         response = client.post(
@@ -287,7 +290,7 @@ class TestMCPInitialize:
         assert response.status_code == 406
 
     def test_initialize_namespace_endpoint(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test initialize on namespace-specific endpoint."""
         response = client.post(
@@ -310,7 +313,7 @@ class TestMCPInitialize:
         assert data["result"]["serverInfo"]["name"].endswith("/shared")
 
     def test_initialize_namespace_sse_alias_post(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """POST /{namespace}/mcp/sse should behave like POST /{namespace}/mcp."""
         response = client.post(
@@ -333,7 +336,7 @@ class TestMCPInitialize:
         assert data["result"]["serverInfo"]["name"].endswith("/shared")
 
     def test_initialize_invalid_protocol_version(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test initialize rejects unsupported protocol versions."""
         response = client.post(
@@ -364,7 +367,7 @@ class TestMCPListTools:
     """Tests for MCP tools/list method."""
 
     def test_list_tools_global(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test listing all tools via global endpoint."""
         response = client.post(
@@ -388,7 +391,7 @@ class TestMCPListTools:
         assert "multiply_ten" in tool_names
 
     def test_list_tools_namespace_specific(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test listing tools for a specific namespace."""
         response = client.post(
@@ -412,7 +415,7 @@ class TestMCPListTools:
         assert "multiply_ten" not in tool_names
 
     def test_list_tools_namespace_sse_alias_post(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """POST /{namespace}/mcp/sse should behave like POST /{namespace}/mcp."""
         response = client.post(
@@ -433,7 +436,7 @@ class TestMCPListTools:
         assert "greet" in tool_names
 
     def test_list_tools_includes_schema(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test that tools include input schemas."""
         response = client.post(
@@ -461,7 +464,7 @@ class TestMCPCallTool:
     """Tests for MCP tools/call method."""
 
     def test_call_tool_success(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test successful tool execution."""
         response = client.post(
@@ -486,7 +489,7 @@ class TestMCPCallTool:
         assert "Hello, Alice!" in content["text"]
 
     def test_call_tool_with_defaults(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test tool call with default arguments."""
         response = client.post(
@@ -507,7 +510,7 @@ class TestMCPCallTool:
         assert "Hello, World!" in data["result"]["content"][0]["text"]
 
     def test_call_tool_wrong_namespace(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test calling a tool from wrong namespace fails."""
         # Try to call 'multiply_ten' (team namespace) from 'shared' endpoint
@@ -530,7 +533,7 @@ class TestMCPCallTool:
         assert "not found" in data["error"]["message"].lower()
 
     def test_call_tool_global_endpoint(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test calling any tool from global endpoint."""
         # Can call tools from any namespace via global /mcp
@@ -560,7 +563,7 @@ class TestNamespaceRouting:
     """Tests for namespace-based routing."""
 
     def test_list_namespaces(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test listing available namespaces."""
         response = client.get("/mcp/namespaces", headers=auth_headers)
@@ -571,7 +574,7 @@ class TestNamespaceRouting:
         assert "team" in data["namespaces"]
 
     def test_mcp_info_global(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test non-standard global discovery endpoint."""
         response = client.get("/mcp/info", headers=auth_headers)
@@ -581,7 +584,7 @@ class TestNamespaceRouting:
         assert "namespace_endpoints" in data
 
     def test_namespace_info(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test getting namespace info via non-standard endpoint."""
         response = client.get("/shared/mcp/info", headers=auth_headers)
@@ -592,7 +595,7 @@ class TestNamespaceRouting:
         assert data["protocol"] == "MCP"
 
     def test_unknown_namespace(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test accessing unknown namespace info returns 404."""
         response = client.get("/nonexistent/mcp/info", headers=auth_headers)
@@ -630,14 +633,12 @@ class TestMCPAuthentication:
         assert response.status_code == 401
 
     def test_auth_disabled_allows_access(
-        self, registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch
+        self, client: SyncASGIClient, monkeypatch: pytest.MonkeyPatch
     ):
         """Test that disabling auth allows access."""
+        # The token is read per request, so the fixture's app serves this too
         monkeypatch.delenv("BEARER_TOKEN", raising=False)
 
-        app = create_mcp_http_app(registry)
-        client = SyncASGIClient(app)
-
         response = client.post(
             "/mcp",
             headers={"Accept": "application/json"},
@@ -652,7 +653,7 @@ class TestMCPAuthentication:
         assert response.status_code == 200
 
     def test_origin_rejected(
-        self, client: SyncASGIClient, auth_headers: dict, monkeypatch: pytest.MonkeyPatch
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str], monkeypatch: pytest.MonkeyPatch
     ):
         """Invalid Origin header is rejected."""
         monkeypatch.setenv("CORS_ORIGINS", "http://allowed.example")
@@ -667,7 +668,7 @@ class TestMCPAuthentication:
         )
         assert response.status_code == 403
 
-    def test_protocol_header_rejected(self, client: SyncASGIClient, auth_headers: dict):
+    def test_protocol_header_rejected(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Unsupported MCP-Protocol-Version header is ignored for compatibility."""
         response = client.post(
             "/mcp",
@@ -688,7 +689,7 @@ class TestJSONRPCErrors:
     """Tests for JSON-RPC error handling."""
 
     def test_invalid_jsonrpc_version(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test error for invalid JSON-RPC version."""
         response = client.post(
@@ -706,7 +707,7 @@ class TestJSONRPCErrors:
         assert data["error"]["code"] == -32600
 
     def test_missing_method(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test error for missing method."""
         response = client.post(
@@ -723,7 +724,7 @@ class TestJSONRPCErrors:
         assert data["error"]["code"] == -32600
 
     def test_unknown_method(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test error for unknown method."""
         response = client.post(
@@ -741,7 +742,7 @@ class TestJSONRPCErrors:
         assert data["error"]["code"] == -32601
 
     def test_invalid_json(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test error for invalid JSON."""
         headers = {"Content-Type": "application/json", **auth_headers}
@@ -756,7 +757,7 @@ class TestJSONRPCErrors:
         assert data["error"]["code"] == -32700  # Parse error
 
     def test_batch_rejected(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """JSON-RPC batching is rejected."""
         response = client.post(
@@ -780,7 +781,7 @@ class TestMCPPing:
     """Tests for MCP ping method."""
 
     def test_ping(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test ping returns empty result."""
         response = client.post(
@@ -806,7 +807,7 @@ class TestMCPNotifications:
     """Tests for MCP notifications (no response expected)."""
 
     def test_initialized_notification(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test initialized notification returns 202."""
         response = client.post(
@@ -823,7 +824,7 @@ class TestMCPNotifications:
         assert response.status_code == 202
 
     def test_notifications_initialized_supported(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """notifications/initialized is supported."""
         response = client.post(
@@ -846,7 +847,7 @@ class TestMCPClientFlow:
     """Tests that simulate a complete MCP client session (init -> tools/list -> call)."""
 
     def test_full_session_flow(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """A complete client flow: initialize -> initialized -> tools/list -> tools/call."""
         # Step 1: initialize
@@ -914,7 +915,7 @@ class TestMCPClientFlow:
         assert "Flow" in call_data["result"]["content"][0]["text"]
 
     def test_session_id_from_initialize(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Initialize creates a unique session; echoing it back works."""
         resp = client.post(
@@ -956,7 +957,7 @@ class TestMCPUnknownNamespacePost:
     """Tests for POST to an unknown namespace (JSON-RPC error path)."""
 
     def test_post_to_unknown_namespace(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """POST to unknown namespace returns JSON-RPC error with available namespaces."""
         resp = client.post(
@@ -983,7 +984,7 @@ class TestMCPCallToolEdgeCases:
     """Edge cases for tools/call."""
 
     def test_call_tool_missing_name(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """tools/call with no name param should return an error."""
         resp = client.post(
@@ -1005,7 +1006,7 @@ class TestMCPCallToolEdgeCases:
         assert has_error, f"Expected error for missing tool name, got: {data}"
 
     def test_call_nonexistent_tool_global(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """tools/call for a tool that doesn't exist returns isError."""
         resp = client.post(
@@ -1139,7 +1140,6 @@ class TestMCPSSEInternals:
     @pytest.fixture
     def live_app(self, live_sse_registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch):
         """App without PYTEST_CURRENT_TEST so SSE functions work normally."""
-        monkeypatch.setenv("BEARER_TOKEN", "test_token")
         monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
         return create_mcp_http_app(live_sse_registry)
 
@@ -1209,7 +1209,7 @@ class TestMCPSSEInternals:
         assert parsed["jsonrpc"] == "2.0"
 
     def test_sse_stream_returns_event_stream_content_type(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """GET /shared/mcp SSE stream has correct content-type."""
         # In pytest mode, stream short-circuits with ': ok\n\n'
@@ -1231,7 +1231,7 @@ class TestProtocolVersionNegotiation:
     """Tests for proper protocol version negotiation."""
 
     def test_negotiate_2024_11_05(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Client requesting 2024-11-05 gets 2024-11-05 back."""
         resp = client.post(
@@ -1248,7 +1248,7 @@ class TestProtocolVersionNegotiation:
         assert data["result"]["protocolVersion"] == "2024-11-05"
 
     def test_negotiate_2025_03_26(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Client requesting 2025-03-26 gets 2025-03-26 back."""
         resp = client.post(
@@ -1265,7 +1265,7 @@ class TestProtocolVersionNegotiation:
         assert data["result"]["protocolVersion"] == "2025-03-26"
 
     def test_no_protocol_version_defaults(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Missing protocolVersion uses server default."""
         resp = client.post(
@@ -1283,7 +1283,7 @@ class TestProtocolVersionNegotiation:
         assert data["result"]["protocolVersion"] in ("2024-11-05", "2025-03-26")
 
     def test_unsupported_version_rejected(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Unsupported protocolVersion returns error."""
         resp = client.post(
@@ -1302,7 +1302,7 @@ class TestProtocolVersionNegotiation:
         assert "supported" in data["error"].get("data", {})
 
     def test_phantom_version_2025_11_25_rejected(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Phantom version 2025-11-25 should no longer be accepted."""
         resp = client.post(
@@ -1327,7 +1327,7 @@ class TestSpecCompliance:
     """Tests for MCP spec compliance fixes."""
 
     def test_response_content_type_no_charset(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Response Content-Type must be exactly 'application/json' without charset."""
         resp = client.post(
@@ -1344,7 +1344,7 @@ class TestSpecCompliance:
         assert ct == "application/json", f"Expected exact 'application/json', got '{ct}'"
 
     def test_response_content_type_namespace_no_charset(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Namespace endpoint Content-Type must also be exact."""
         resp = client.post(
@@ -1361,7 +1361,7 @@ class TestSpecCompliance:
         assert ct == "application/json"
 
     def test_post_wrong_content_type_rejected(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """POST with wrong Content-Type should return -32700 parse error."""
         resp = client.post(
@@ -1375,7 +1375,7 @@ class TestSpecCompliance:
         assert "Content-Type" in data["error"]["message"]
 
     def test_post_wrong_content_type_namespace(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Namespace POST with wrong Content-Type should return -32700."""
         resp = client.post(
@@ -1388,7 +1388,7 @@ class TestSpecCompliance:
         assert data["error"]["code"] == -32700
 
     def test_post_missing_content_type_accepted(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """POST with missing Content-Type should be accepted (lenient)."""
         # httpx auto-adds Content-Type for json=, so use content= with no CT header
@@ -1406,7 +1406,7 @@ class TestSpecCompliance:
             assert "Content-Type" not in data["error"].get("message", "")
 
     def test_delete_without_session_returns_400(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """DELETE /mcp without Mcp-Session-Id returns 400."""
         resp = client.delete("/mcp", headers=auth_headers)
@@ -1415,7 +1415,7 @@ class TestSpecCompliance:
         assert data["error"]["code"] == -32600
 
     def test_delete_with_invalid_session_returns_404(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """DELETE /mcp with invalid session returns 404."""
         resp = client.delete(
@@ -1425,7 +1425,7 @@ class TestSpecCompliance:
         assert resp.status_code == 404
 
     def test_delete_with_valid_session_returns_200(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """DELETE /mcp with valid session terminates it and returns 200."""
         # Create session via initialize
@@ -1465,14 +1465,14 @@ class TestSpecCompliance:
         assert resp.status_code == 404
 
     def test_delete_namespace_without_session_returns_400(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """DELETE /{namespace}/mcp without session returns 400."""
         resp = client.delete("/shared/mcp", headers=auth_headers)
         assert resp.status_code == 400
 
     def test_202_notification_without_session_has_no_session_header(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """202 responses for notifications without session header don't include one."""
         resp = client.post(
@@ -1488,7 +1488,7 @@ class TestSpecCompliance:
         assert resp.headers.get("Mcp-Session-Id") is None
 
     def test_202_notification_with_session_echoes_it(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """202 responses echo back Mcp-Session-Id when client sends one."""
         # Create a session first
@@ -1519,7 +1519,7 @@ class TestSpecCompliance:
         assert resp.headers.get("Mcp-Session-Id") == session_id
 
     def test_unknown_namespace_echoes_request_id(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Unknown namespace error should echo the request id from body, not None."""
         resp = client.post(
@@ -1537,7 +1537,7 @@ class TestSpecCompliance:
         assert data["error"]["code"] == -32600
 
     def test_unknown_namespace_without_session_has_no_session_header(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Unknown namespace error without session header doesn't include one."""
         resp = client.post(
@@ -1559,7 +1559,7 @@ class TestMCPSessionManagement:
     """Tests for per-client MCP session management."""
 
     def test_initialize_creates_unique_session(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Each initialize call creates a unique session ID."""
         sessions = set()
@@ -1584,7 +1584,7 @@ class TestMCPSessionManagement:
         assert len(sessions) == 3, f"Expected 3 unique sessions, got {sessions}"
 
     def test_valid_session_accepted(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Requests with a valid session ID are accepted."""
         resp = client.post(
@@ -1616,7 +1616,7 @@ class TestMCPSessionManagement:
         assert "result" in resp.json()
 
     def test_invalid_session_returns_404(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Requests with an invalid session ID return 404."""
         resp = client.post(
@@ -1635,7 +1635,7 @@ class TestMCPSessionManagement:
         assert "session" in data["error"]["message"].lower()
 
     def test_no_session_header_accepted_lenient(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Requests without Mcp-Session-Id are accepted (lenient mode)."""
         resp = client.post(
@@ -1652,7 +1652,7 @@ class TestMCPSessionManagement:
         assert resp.json()["result"] == {}
 
     def test_delete_terminates_session(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """DELETE with valid session removes it; subsequent requests get 404."""
         # Create session
@@ -1691,7 +1691,7 @@ class TestMCPSessionManagement:
         assert resp.status_code == 404
 
     def test_namespace_session_lifecycle(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Session works across namespace endpoints."""
         # Initialize on namespace endpoint
@@ -1733,7 +1733,7 @@ class TestMCPSessionManagement:
         assert resp.status_code == 200
 
     def test_sse_get_with_invalid_session_returns_404(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """GET SSE with invalid session returns 404."""
         resp = client.get(
@@ -1747,7 +1747,7 @@ class TestMCPSessionManagement:
         assert resp.status_code == 404
 
     def test_initialize_error_does_not_create_session(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Failed initialize (bad protocol version) should not create a session."""
         resp = client.post(
@@ -8,6 +8,8 @@ reserved prefix guards, and global endpoint backward compatibility.
 from __future__ import annotations
 
 import json
+from types import MappingProxyType
+from typing import Mapping
 
 import pytest
 from pydantic import BaseModel, ConfigDict, Field
@@ -18,6 +20,24 @@ from app.transports.openapi_server import create_openapi_app
 from tests.utils.sync_client import SyncASGIClient
 
 
+class GreetInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    name: str = Field(default="World", description="Name to greet")
+
+
+async def greet_handler(payload: GreetInput) -> str:
+    return f"Hello, {payload.name}!"
+
+
+class TeamInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    value: int = Field(default=1, description="A number")
+
+
+async def team_handler(payload: TeamInput) -> int:
+    return payload.value * 10
+
+
 # ==================== Fixtures ====================
 
 
@@ -26,15 +46,6 @@ def registry() -> ToolRegistry:
     """Fresh registry with test tools in multiple namespaces."""
     reset_registry()
     reg = ToolRegistry()
-
-    class GreetInput(BaseModel):
-        model_config = ConfigDict(extra="forbid")
-        name: str = Field(default="World", description="Name to greet")
-
-    async def greet_handler(payload: GreetInput) -> str:
-        return f"Hello, {payload.name}!"
-
-    GreetInput.model_rebuild(force=True)
     reg.register(
         ToolDefinition(
             name="greet",
@@ -45,14 +56,6 @@ def registry() -> ToolRegistry:
         namespace="shared",
     )
 
-    class TeamInput(BaseModel):
-        model_config = ConfigDict(extra="forbid")
-        value: int = Field(default=1, description="A number")
-
-    async def team_handler(payload: TeamInput) -> int:
-        return payload.value * 10
-
-    TeamInput.model_rebuild(force=True)
     reg.register(
         ToolDefinition(
             name="multiply_ten",
@@ -68,9 +71,8 @@ def registry() -> ToolRegistry:
 
 
 @pytest.fixture
-def mcp_client(registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch) -> SyncASGIClient:
+def mcp_client(registry: ToolRegistry) -> SyncASGIClient:
     """MCP test client."""
-    monkeypatch.setenv("BEARER_TOKEN", "test_token")
     app = create_mcp_http_app(registry)
     client = SyncASGIClient(app)
     try:
@@ -80,9 +82,8 @@ def mcp_client(registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch) -> SyncA
 
 
 @pytest.fixture
-def openapi_client(registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch) -> SyncASGIClient:
+def openapi_client(registry: ToolRegistry) -> SyncASGIClient:
     """OpenAPI test client."""
-    monkeypatch.setenv("BEARER_TOKEN", "test_token")
     app = create_openapi_app(registry)
     client = SyncASGIClient(app)
     try:
@@ -91,17 +92,17 @@ def openapi_client(registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch) -> S
         client.close()
 
 
-@pytest.fixture
-def auth_headers() -> dict:
-    return {
+@pytest.fixture(scope="session")
+def auth_headers() -> Mapping[str, str]:
+    return MappingProxyType({
         "Authorization": "Bearer test_token",
         "Accept": "application/json, text/event-stream",
-    }
+    })
 
 
-@pytest.fixture
-def auth_headers_json() -> dict:
-    return {"Authorization": "Bearer test_token"}
+@pytest.fixture(scope="session")
+def auth_headers_json() -> Mapping[str, str]:
+    return MappingProxyType({"Authorization": "Bearer test_token"})
 
 
 def _jsonrpc(method: str, params: dict | None = None, req_id: int = 1) -> dict:
@@ -118,7 +119,7 @@ def _jsonrpc(method: str, params: dict | None = None, req_id: int = 1) -> dict:
 class TestMCPNamespaceFirst:
     """Tests for the new /{namespace}/mcp URL pattern."""
 
-    def test_initialize(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_initialize(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         body = _jsonrpc("initialize", {"protocolVersion": "2024-11-05", "clientInfo": {"name": "test"}})
         resp = mcp_client.post("/shared/mcp", json=body, headers=auth_headers)
         assert resp.status_code == 200
@@ -126,7 +127,7 @@ class TestMCPNamespaceFirst:
         assert data["result"]["protocolVersion"] == "2024-11-05"
         assert "shared" in data["result"]["serverInfo"]["name"]
 
-    def test_tools_list(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_tools_list(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         body = _jsonrpc("tools/list")
         resp = mcp_client.post("/shared/mcp", json=body, headers=auth_headers)
         assert resp.status_code == 200
@@ -136,7 +137,7 @@ class TestMCPNamespaceFirst:
         # team tools should NOT appear in shared namespace
         assert "multiply_ten" not in names
 
-    def test_tools_call(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_tools_call(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         body = _jsonrpc("tools/call", {"name": "greet", "arguments": {"name": "Test"}})
         resp = mcp_client.post("/shared/mcp", json=body, headers=auth_headers)
         assert resp.status_code == 200
@@ -144,7 +145,7 @@ class TestMCPNamespaceFirst:
         assert result["isError"] is False
         assert "Hello, Test!" in result["content"][0]["text"]
 
-    def test_team_namespace(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_team_namespace(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         body = _jsonrpc("tools/list")
         resp = mcp_client.post("/team/mcp", json=body, headers=auth_headers)
         assert resp.status_code == 200
@@ -153,7 +154,7 @@ class TestMCPNamespaceFirst:
         assert "multiply_ten" in names
         assert "greet" not in names
 
-    def test_unknown_namespace(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_unknown_namespace(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         body = _jsonrpc("tools/list")
         resp = mcp_client.post("/nonexistent/mcp", json=body, headers=auth_headers)
         assert resp.status_code == 200
@@ -161,34 +162,34 @@ class TestMCPNamespaceFirst:
         assert data["error"]["code"] == -32600
         assert "nonexistent" in data["error"]["message"]
 
-    def test_sse_endpoint(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_sse_endpoint(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         headers = {**auth_headers, "Accept": "text/event-stream"}
         resp = mcp_client.get("/shared/mcp", headers=headers)
         assert resp.status_code == 200
 
-    def test_sse_alias(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_sse_alias(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         headers = {**auth_headers, "Accept": "text/event-stream"}
         resp = mcp_client.get("/shared/mcp/sse", headers=headers)
         assert resp.status_code == 200
 
-    def test_sse_alias_post(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_sse_alias_post(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         body = _jsonrpc("tools/list")
         resp = mcp_client.post("/shared/mcp/sse", json=body, headers=auth_headers)
         assert resp.status_code == 200
         assert "tools" in resp.json()["result"]
 
-    def test_delete_without_session_returns_400(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_delete_without_session_returns_400(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         resp = mcp_client.request("DELETE", "/shared/mcp", headers=auth_headers)
         assert resp.status_code == 400
 
-    def test_info_endpoint(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_info_endpoint(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         resp = mcp_client.get("/shared/mcp/info", headers=auth_headers)
         assert resp.status_code == 200
         data = resp.json()
         assert data["namespace"] == "shared"
         assert data["endpoint"] == "/shared/mcp"
 
-    def test_no_deprecation_header(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_no_deprecation_header(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """New pattern should NOT have deprecation headers."""
         body = _jsonrpc("tools/list")
         resp = mcp_client.post("/shared/mcp", json=body, headers=auth_headers)
@@ -204,7 +205,7 @@ class TestMCPReservedPrefixes:
 
     @pytest.mark.parametrize("prefix", sorted(RESERVED_PREFIXES))
     def test_reserved_prefix_returns_404(
-        self, mcp_client: SyncASGIClient, auth_headers: dict, prefix: str
+        self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str], prefix: str
     ):
         body = _jsonrpc("tools/list")
         resp = mcp_client.post(f"/{prefix}/mcp", json=body, headers=auth_headers)
@@ -217,7 +218,7 @@ class TestMCPReservedPrefixes:
 class TestOpenAPINamespaceFirst:
     """Tests for the new /{namespace}/openapi/* URL pattern."""
 
-    def test_health(self, openapi_client: SyncASGIClient, auth_headers_json: dict):
+    def test_health(self, openapi_client: SyncASGIClient, auth_headers_json: Mapping[str, str]):
         resp = openapi_client.get("/shared/openapi/health")  # no auth needed
         # Actually our ns health doesn't require auth because it's a GET health
         # but it does validate namespace
@@ -229,7 +230,7 @@ class TestOpenAPINamespaceFirst:
         assert data["namespace"] == "shared"
         assert data["status"] == "healthy"
 
-    def test_list_tools(self, openapi_client: SyncASGIClient, auth_headers_json: dict):
+    def test_list_tools(self, openapi_client: SyncASGIClient, auth_headers_json: Mapping[str, str]):
         resp = openapi_client.get("/shared/openapi/tools", headers=auth_headers_json)
         assert resp.status_code == 200
         data = resp.json()
@@ -238,7 +239,7 @@ class TestOpenAPINamespaceFirst:
         assert "greet" in names
         assert "multiply_ten" not in names
 
-    def test_list_tools_team(self, openapi_client: SyncASGIClient, auth_headers_json: dict):
+    def test_list_tools_team(self, openapi_client: SyncASGIClient, auth_headers_json: Mapping[str, str]):
         resp = openapi_client.get("/team/openapi/tools", headers=auth_headers_json)
         assert resp.status_code == 200
         data = resp.json()
@@ -247,7 +248,7 @@ class TestOpenAPINamespaceFirst:
         assert "multiply_ten" in names
         assert "greet" not in names
 
-    def test_execute_tool(self, openapi_client: SyncASGIClient, auth_headers_json: dict):
+    def test_execute_tool(self, openapi_client: SyncASGIClient, auth_headers_json: Mapping[str, str]):
         resp = openapi_client.post(
             "/shared/openapi/tools/greet",
             json={"name": "Routing"},
@@ -258,7 +259,7 @@ class TestOpenAPINamespaceFirst:
         assert data["tool"] == "greet"
         assert "Hello, Routing!" in str(data["result"])
 
-    def test_execute_tool_wrong_namespace(self, openapi_client: SyncASGIClient, auth_headers_json: dict):
+    def test_execute_tool_wrong_namespace(self, openapi_client: SyncASGIClient, auth_headers_json: Mapping[str, str]):
         """Tool from shared should not be callable via team namespace."""
         resp = openapi_client.post(
             "/team/openapi/tools/greet",
@@ -267,11 +268,11 @@ class TestOpenAPINamespaceFirst:
         )
         assert resp.status_code == 404
 
-    def test_unknown_namespace(self, openapi_client: SyncASGIClient, auth_headers_json: dict):
+    def test_unknown_namespace(self, openapi_client: SyncASGIClient, auth_headers_json: Mapping[str, str]):
         resp = openapi_client.get("/nonexistent/openapi/tools", headers=auth_headers_json)
         assert resp.status_code == 404
 
-    def test_unknown_tool(self, openapi_client: SyncASGIClient, auth_headers_json: dict):
+    def test_unknown_tool(self, openapi_client: SyncASGIClient, auth_headers_json: Mapping[str, str]):
         resp = openapi_client.post(
             "/shared/openapi/tools/nonexistent",
             json={},
@@ -288,7 +289,7 @@ class TestOpenAPIReservedPrefixes:
 
     @pytest.mark.parametrize("prefix", ["api", "docs", "assets", "static"])
     def test_reserved_prefix_returns_404(
-        self, openapi_client: SyncASGIClient, auth_headers_json: dict, prefix: str
+        self, openapi_client: SyncASGIClient, auth_headers_json: Mapping[str, str], prefix: str
     ):
         resp = openapi_client.get(f"/{prefix}/openapi/tools", headers=auth_headers_json)
         assert resp.status_code == 404
@@ -305,7 +306,7 @@ class TestOpenAPIGlobalBackwardCompat:
         assert resp.status_code == 200
         assert resp.json()["status"] == "healthy"
 
-    def test_global_tools_list(self, openapi_client: SyncASGIClient, auth_headers_json: dict):
+    def test_global_tools_list(self, openapi_client: SyncASGIClient, auth_headers_json: Mapping[str, str]):
         resp = openapi_client.get("/tools", headers=auth_headers_json)
         assert resp.status_code == 200
         tools = resp.json()["tools"]
@@ -314,7 +315,7 @@ class TestOpenAPIGlobalBackwardCompat:
         assert "greet" in names
         assert "multiply_ten" in names
 
-    def test_global_tool_execution(self, openapi_client: SyncASGIClient, auth_headers_json: dict):
+    def test_global_tool_execution(self, openapi_client: SyncASGIClient, auth_headers_json: Mapping[str, str]):
         resp = openapi_client.post("/tools/greet", json={"name": "Global"}, headers=auth_headers_json)
         assert resp.status_code == 200
         assert "Hello, Global!" in str(resp.json()["result"])
@@ -326,7 +327,7 @@ class TestOpenAPIGlobalBackwardCompat:
 class TestMCPGlobalBackwardCompat:
     """Ensure global /mcp endpoint still works."""
 
-    def test_global_tools_list(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_global_tools_list(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         body = _jsonrpc("tools/list")
         resp = mcp_client.post("/mcp", json=body, headers=auth_headers)
         assert resp.status_code == 200
@@ -335,7 +336,7 @@ class TestMCPGlobalBackwardCompat:
         assert "greet" in names
         assert "multiply_ten" in names
 
-    def test_global_sse(self, mcp_client: SyncASGIClient, auth_headers: dict):
+    def test_global_sse(self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]):
         headers = {**auth_headers, "Accept": "text/event-stream"}
         resp = mcp_client.get("/mcp", headers=headers)
         assert resp.status_code == 200
@@ -348,7 +349,7 @@ class TestMCPNamespaceSessionManagement:
     """Session management tests for namespace-scoped MCP endpoints."""
 
     def test_namespace_initialize_returns_session(
-        self, mcp_client: SyncASGIClient, auth_headers: dict
+        self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         body = _jsonrpc("initialize", {"protocolVersion": "2024-11-05", "clientInfo": {"name": "ns-test"}})
         resp = mcp_client.post("/shared/mcp", json=body, headers=auth_headers)
@@ -356,7 +357,7 @@ class TestMCPNamespaceSessionManagement:
         assert resp.headers.get("Mcp-Session-Id")
 
     def test_namespace_delete_with_valid_session(
-        self, mcp_client: SyncASGIClient, auth_headers: dict
+        self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         # Create session
         body = _jsonrpc("initialize", {"protocolVersion": "2024-11-05", "clientInfo": {"name": "del-test"}})
@@ -371,7 +372,7 @@ class TestMCPNamespaceSessionManagement:
         assert resp.status_code == 200
 
     def test_namespace_invalid_session_rejected(
-        self, mcp_client: SyncASGIClient, auth_headers: dict
+        self, mcp_client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         body = _jsonrpc("tools/list")
         resp = mcp_client.post(
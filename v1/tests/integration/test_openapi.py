@@ -4,14 +4,28 @@ Integration tests for OpenAPI transport.
 
 from __future__ import annotations
 
+import json
+from types import MappingProxyType
+from typing import Mapping
+
 import pytest
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.registry import ToolRegistry, ToolDefinition, reset_registry
-from app.transports.openapi_server import create_openapi_app
 from tests.utils.sync_client import SyncASGIClient
 
 
+# Request bodies are encoded once so tests post raw bytes instead of
+# re-serializing identical payloads on every call.
+EMPTY_BODY = b"{}"
+ECHO_BODY = json.dumps({"message": "Hello World"}).encode()
+ECHO_UNAUTH_BODY = json.dumps({"message": "test"}).encode()
+ECHO_EXTRA_FIELD_BODY = json.dumps({"message": "hello", "extra_field": "bad"}).encode()
+ADD_BODY = json.dumps({"a": 5, "b": 3}).encode()
+ADD_INVALID_BODY = json.dumps({"a": "not_a_number", "b": 3}).encode()
+ADD_MISSING_FIELD_BODY = json.dumps({"a": "invalid"}).encode()
+
+
 # ==================== Fixtures ====================
 
 
@@ -28,7 +42,6 @@ def registry() -> ToolRegistry:
     async def echo_handler(payload: EchoInput) -> str:
         return f"Echo: {payload.message}"
 
-    EchoInput.model_rebuild(force=True)
     reg.register(
         ToolDefinition(
             name="echo",
@@ -47,7 +60,6 @@ def registry() -> ToolRegistry:
     async def add_handler(payload: AddInput) -> int:
         return payload.a + payload.b
 
-    AddInput.model_rebuild(force=True)
     reg.register(
         ToolDefinition(
             name="add",
@@ -63,9 +75,10 @@ def registry() -> ToolRegistry:
 
 
 @pytest.fixture
-def client(registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch) -> SyncASGIClient:
+def client(registry: ToolRegistry) -> SyncASGIClient:
     """Test client with auth enabled."""
-    monkeypatch.setenv("BEARER_TOKEN", "test_token")
+    from app.transports.openapi_server import create_openapi_app
+
     app = create_openapi_app(registry)
     client = SyncASGIClient(app)
     try:
@@ -74,10 +87,10 @@ def client(registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch) -> SyncASGIC
         client.close()
 
 
-@pytest.fixture
-def auth_headers() -> dict:
-    """Auth headers for requests."""
-    return {"Authorization": "Bearer test_token"}
+@pytest.fixture(scope="session")
+def json_headers(auth_headers: Mapping[str, str]) -> Mapping[str, str]:
+    """Auth headers for requests posting pre-encoded JSON bodies."""
+    return MappingProxyType({**auth_headers, "Content-Type": "application/json"})
 
 
 # ==================== Health Endpoint Tests ====================
@@ -119,7 +132,7 @@ class TestAuthentication:
         assert response.status_code == 401
 
     def test_list_tools_with_valid_auth(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test /tools works with valid auth."""
         response = client.get("/tools", headers=auth_headers)
@@ -145,14 +158,12 @@ class TestAuthentication:
         assert response.status_code == 401
 
     def test_auth_disabled_allows_access(
-        self, registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch
+        self, client: SyncASGIClient, monkeypatch: pytest.MonkeyPatch
     ):
         """Test that disabling auth allows access without token."""
+        # The token is read per request, so the fixture's app serves this too
         monkeypatch.delenv("BEARER_TOKEN", raising=False)
 
-        app = create_openapi_app(registry)
-        client = SyncASGIClient(app)
-
         response = client.get("/tools")
 
         assert response.status_code == 200
@@ -164,39 +175,22 @@ class TestAuthentication:
 class TestToolListing:
     """Tests for tool listing endpoint."""
 
-    def test_list_tools_returns_all_tools(
-        self, client: SyncASGIClient, auth_headers: dict
+    def test_list_tools_shape(
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
-        """Test that all registered tools are listed."""
+        """Test listed tools include names, input schemas and descriptions."""
         response = client.get("/tools", headers=auth_headers)
 
         data = response.json()
-        tool_names = [t["name"] for t in data["tools"]]
+        by_name = {t["name"]: t for t in data["tools"]}
 
-        assert "echo" in tool_names
-        assert "add" in tool_names
+        assert "echo" in by_name
+        assert "add" in by_name
 
-    def test_list_tools_includes_schema(
-        self, client: SyncASGIClient, auth_headers: dict
-    ):
-        """Test that tools include input schemas."""
-        response = client.get("/tools", headers=auth_headers)
-
-        data = response.json()
-        echo_tool = next(t for t in data["tools"] if t["name"] == "echo")
+        echo_tool = by_name["echo"]
 
         assert "input_schema" in echo_tool
         assert echo_tool["input_schema"]["type"] == "object"
-
-    def test_list_tools_includes_descriptions(
-        self, client: SyncASGIClient, auth_headers: dict
-    ):
-        """Test that tools include descriptions."""
-        response = client.get("/tools", headers=auth_headers)
-
-        data = response.json()
-        echo_tool = next(t for t in data["tools"] if t["name"] == "echo")
-
         assert echo_tool["description"] == "Echoes a message"
 
 
@@ -207,13 +201,13 @@ class TestToolExecution:
     """Tests for tool execution endpoints."""
 
     def test_call_tool_success(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, json_headers: Mapping[str, str]
     ):
         """Test successful tool execution."""
         response = client.post(
             "/tools/echo",
-            headers=auth_headers,
-            json={"message": "Hello World"},
+            headers=json_headers,
+            content=ECHO_BODY,
         )
 
         assert response.status_code == 200
@@ -222,13 +216,13 @@ class TestToolExecution:
         assert data["result"] == "Echo: Hello World"
 
     def test_call_tool_with_defaults(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, json_headers: Mapping[str, str]
     ):
         """Test tool execution with default values."""
         response = client.post(
             "/tools/echo",
-            headers=auth_headers,
-            json={},
+            headers=json_headers,
+            content=EMPTY_BODY,
         )
 
         assert response.status_code == 200
@@ -236,13 +230,13 @@ class TestToolExecution:
         assert data["result"] == "Echo: hello"
 
     def test_call_add_tool(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, json_headers: Mapping[str, str]
     ):
         """Test calling the add tool."""
         response = client.post(
             "/tools/add",
-            headers=auth_headers,
-            json={"a": 5, "b": 3},
+            headers=json_headers,
+            content=ADD_BODY,
         )
 
         assert response.status_code == 200
@@ -250,13 +244,13 @@ class TestToolExecution:
         assert data["result"] == 8
 
     def test_call_nonexistent_tool(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, json_headers: Mapping[str, str]
     ):
         """Test calling a tool that doesn't exist."""
         response = client.post(
             "/tools/nonexistent",
-            headers=auth_headers,
-            json={},
+            headers=json_headers,
+            content=EMPTY_BODY,
         )
 
         assert response.status_code == 404
@@ -265,34 +259,53 @@ class TestToolExecution:
         self, client: SyncASGIClient
     ):
         """Test that tool execution requires auth."""
-        response = client.post("/tools/echo", json={"message": "test"})
+        response = client.post(
+            "/tools/echo",
+            headers={"Content-Type": "application/json"},
+            content=ECHO_UNAUTH_BODY,
+        )
 
         assert response.status_code == 401
 
     def test_call_tool_invalid_payload(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, json_headers: Mapping[str, str]
     ):
         """Test tool execution with invalid payload type."""
         response = client.post(
             "/tools/add",
-            headers=auth_headers,
-            json={"a": "not_a_number", "b": 3},
+            headers=json_headers,
+            content=ADD_INVALID_BODY,
         )
 
         assert response.status_code == 422  # Validation error
 
     def test_call_tool_extra_field_rejected(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, json_headers: Mapping[str, str]
     ):
         """Test that extra fields are rejected (extra=forbid)."""
         response = client.post(
             "/tools/echo",
-            headers=auth_headers,
-            json={"message": "hello", "extra_field": "bad"},
+            headers=json_headers,
+            content=ECHO_EXTRA_FIELD_BODY,
         )
 
         assert response.status_code == 422
 
+    @pytest.mark.parametrize("body", [b"{not json", b"[1, 2]"], ids=["malformed", "array"])
+    @pytest.mark.parametrize(
+        "path",
+        ["/tools/echo", "/tools/default__echo", "/test/openapi/tools/echo"],
+        ids=["native", "dynamic", "namespace"],
+    )
+    def test_call_tool_non_object_body_rejected(
+        self, client: SyncASGIClient, json_headers: Mapping[str, str], path: str, body: bytes
+    ):
+        """Test that malformed or non-object JSON bodies get the same error on every route."""
+        response = client.post(path, headers=json_headers, content=body)
+
+        assert response.status_code == 422
+        assert response.json()["error"]["code"] == "validation_error"
+
 
 # ==================== Error Handling Tests ====================
 
@@ -301,13 +314,13 @@ class TestErrorHandling:
     """Tests for error handling."""
 
     def test_tool_not_found_error(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, json_headers: Mapping[str, str]
     ):
         """Test error response for nonexistent tool."""
         response = client.post(
             "/tools/does_not_exist",
-            headers=auth_headers,
-            json={},
+            headers=json_headers,
+            content=EMPTY_BODY,
         )
 
         assert response.status_code == 404
@@ -315,13 +328,13 @@ class TestErrorHandling:
         assert "not found" in data["detail"].lower()
 
     def test_validation_error_format(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, json_headers: Mapping[str, str]
     ):
         """Test validation error response format."""
         response = client.post(
             "/tools/add",
-            headers=auth_headers,
-            json={"a": "invalid"},  # Should be int
+            headers=json_headers,
+            content=ADD_MISSING_FIELD_BODY,  # "a" should be int
         )
 
         assert response.status_code == 422
@@ -337,7 +350,7 @@ class TestAdminRoutes:
         assert response.status_code == 401
 
     def test_admin_tools_lists_native(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         response = client.get("/admin/tools", headers=auth_headers)
         assert response.status_code == 200
@@ -347,7 +360,7 @@ class TestAdminRoutes:
         assert data["native"]["count"] >= 2
 
     def test_admin_reload_all(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         response = client.post("/admin/reload", headers=auth_headers)
         assert response.status_code == 200
@@ -356,13 +369,13 @@ class TestAdminRoutes:
         assert "results" in data
 
     def test_admin_reload_namespace_error(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         response = client.post("/admin/reload/does-not-exist", headers=auth_headers)
         assert response.status_code == 400
 
     def test_admin_search_registry(
-        self, client: SyncASGIClient, auth_headers: dict, monkeypatch: pytest.MonkeyPatch
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str], monkeypatch: pytest.MonkeyPatch
     ):
         from app.external.registry_client import MCPRegistryClient
 
@@ -382,7 +395,7 @@ class TestAdminRoutes:
         assert data[0]["name"] == "demo"
 
     def test_admin_fastmcp_reload_unavailable(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         response = client.post("/admin/fastmcp/reload", headers=auth_headers)
         assert response.status_code == 503
@@ -390,10 +403,9 @@ class TestAdminRoutes:
     def test_admin_fastmcp_reload_success(
         self,
         registry: ToolRegistry,
-        auth_headers: dict,
-        monkeypatch: pytest.MonkeyPatch,
+        auth_headers: Mapping[str, str],
     ):
-        monkeypatch.setenv("BEARER_TOKEN", "test_token")
+        from app.transports.openapi_server import create_openapi_app
 
         class StubManager:
             async def sync_from_db(self):
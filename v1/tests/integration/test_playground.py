@@ -5,39 +5,39 @@ Integration tests for Playground API (/api/playground).
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Mapping
 
 import pytest
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.registry import ToolRegistry, ToolDefinition, reset_registry
 from app.web.server import create_web_app
-from app.reload import init_reloader, reset_reloader
 from tests.utils.sync_client import SyncASGIClient
 
 
+class PlaygroundInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    value: str = Field(default="test", description="Test value")
+
+
+async def playground_handler(payload: PlaygroundInput) -> dict:
+    return {"echo": payload.value, "status": "ok"}
+
+
 # ==================== Fixtures ====================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def registry() -> ToolRegistry:
-    """Fresh registry with test tools."""
+    """Registry with test tools, shared by the module; no test mutates it."""
     reset_registry()
     reg = ToolRegistry()
-
-    class TestInput(BaseModel):
-        model_config = ConfigDict(extra="forbid")
-        value: str = Field(default="test", description="Test value")
-
-    async def test_handler(payload: TestInput) -> dict:
-        return {"echo": payload.value, "status": "ok"}
-
-    TestInput.model_rebuild(force=True)
     reg.register(
         ToolDefinition(
             name="playground_test_tool",
             description="Test tool for playground",
-            input_model=TestInput,
-            handler=test_handler,
+            input_model=PlaygroundInput,
+            handler=playground_handler,
         ),
         namespace="shared",
     )
@@ -54,34 +54,29 @@ def tools_dir(tmp_path: Path) -> Path:
     return tools.parent
 
 
+@pytest.fixture(scope="module")
+def web_app(registry: ToolRegistry, tmp_path_factory: pytest.TempPathFactory):
+    """Web app built once per module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATA_DIR", str(tmp_path_factory.mktemp("playground_data")))
+        yield create_web_app(registry)
+
+
 @pytest.fixture
 def client(
-    registry: ToolRegistry,
+    web_app,
     tools_dir: Path,
     monkeypatch: pytest.MonkeyPatch,
 ) -> SyncASGIClient:
     """Test client with auth enabled."""
-    monkeypatch.setenv("BEARER_TOKEN", "test_token")
     monkeypatch.setenv("DATA_DIR", str(tools_dir.parent))
 
-    reset_reloader()
-    init_reloader(registry, str(tools_dir))
-
-    app = create_web_app(registry)
-    client = SyncASGIClient(app)
+    client = SyncASGIClient(web_app)
     try:
         yield client
     finally:
         client.close()
 
-    reset_reloader()
-
-
-@pytest.fixture
-def auth_headers() -> dict:
-    """Bearer auth headers."""
-    return {"Authorization": "Bearer test_token"}
-
 
 # ==================== List Tools Tests ====================
 
@@ -89,7 +84,7 @@ def auth_headers() -> dict:
 class TestPlaygroundListTools:
     """Tests for GET /api/playground/tools endpoint."""
 
-    def test_list_tools_success(self, client: SyncASGIClient, auth_headers: dict):
+    def test_list_tools_success(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test listing playground tools."""
         response = client.get("/api/playground/tools", headers=auth_headers)
 
@@ -202,7 +197,7 @@ class TestPlaygroundExecute:
         import sys
         monkeypatch.setitem(sys.modules, "httpx", FakeHttpxModule())
 
-    def test_execute_tool_direct(self, client: SyncASGIClient, auth_headers: dict):
+    def test_execute_tool_direct(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test executing a tool directly."""
         response = client.post(
             "/api/playground/execute",
@@ -221,7 +216,7 @@ class TestPlaygroundExecute:
         assert data["transport"] == "direct"
         assert data["result"]["echo"] == "hello"
 
-    def test_execute_tool_openapi(self, client: SyncASGIClient, auth_headers: dict, monkeypatch: pytest.MonkeyPatch):
+    def test_execute_tool_openapi(self, client: SyncASGIClient, auth_headers: Mapping[str, str], monkeypatch: pytest.MonkeyPatch):
         """Test executing a tool via OpenAPI proxy."""
         self._install_fake_httpx(monkeypatch)
         response = client.post(
@@ -240,7 +235,7 @@ class TestPlaygroundExecute:
         assert data["transport"] == "openapi"
         assert data["result"]["echo"] == "openapi_test"
 
-    def test_execute_tool_mcp(self, client: SyncASGIClient, auth_headers: dict, monkeypatch: pytest.MonkeyPatch):
+    def test_execute_tool_mcp(self, client: SyncASGIClient, auth_headers: Mapping[str, str], monkeypatch: pytest.MonkeyPatch):
         """Test executing a tool via MCP proxy."""
         self._install_fake_httpx(monkeypatch)
         response = client.post(
@@ -260,7 +255,7 @@ class TestPlaygroundExecute:
         assert data["transport"] == "mcp"
         assert "content" in data["result"]
 
-    def test_execute_tool_not_found(self, client: SyncASGIClient, auth_headers: dict):
+    def test_execute_tool_not_found(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test executing non-existent tool."""
         response = client.post(
             "/api/playground/execute",
@@ -274,7 +269,7 @@ class TestPlaygroundExecute:
 
         assert response.status_code == 404
 
-    def test_execute_tool_default_transport(self, client: SyncASGIClient, auth_headers: dict, monkeypatch: pytest.MonkeyPatch):
+    def test_execute_tool_default_transport(self, client: SyncASGIClient, auth_headers: Mapping[str, str], monkeypatch: pytest.MonkeyPatch):
         """Test default transport is 'openapi'."""
         self._install_fake_httpx(monkeypatch)
         response = client.post(
@@ -290,7 +285,7 @@ class TestPlaygroundExecute:
         data = response.json()
         assert data["transport"] == "openapi"
 
-    def test_execute_tool_error_type_network(self, client: SyncASGIClient, auth_headers: dict, monkeypatch: pytest.MonkeyPatch):
+    def test_execute_tool_error_type_network(self, client: SyncASGIClient, auth_headers: Mapping[str, str], monkeypatch: pytest.MonkeyPatch):
         """Test network error classification."""
         self._install_fake_httpx_error(monkeypatch, "network")
         response = client.post(
@@ -308,7 +303,7 @@ class TestPlaygroundExecute:
         assert data["success"] is False
         assert data["error_type"] == "network"
 
-    def test_execute_tool_error_type_server(self, client: SyncASGIClient, auth_headers: dict, monkeypatch: pytest.MonkeyPatch):
+    def test_execute_tool_error_type_server(self, client: SyncASGIClient, auth_headers: Mapping[str, str], monkeypatch: pytest.MonkeyPatch):
         """Test server error classification."""
         self._install_fake_httpx_error(monkeypatch, "server")
         response = client.post(
@@ -341,7 +336,7 @@ class TestPlaygroundExecute:
 class TestPlaygroundMCP:
     """Tests for POST /api/playground/mcp endpoint."""
 
-    def test_mcp_initialize(self, client: SyncASGIClient, auth_headers: dict):
+    def test_mcp_initialize(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test MCP initialize method."""
         response = client.post(
             "/api/playground/mcp",
@@ -361,7 +356,7 @@ class TestPlaygroundMCP:
         assert "protocolVersion" in data["result"]
         assert "capabilities" in data["result"]
 
-    def test_mcp_tools_list(self, client: SyncASGIClient, auth_headers: dict):
+    def test_mcp_tools_list(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test MCP tools/list method."""
         response = client.post(
             "/api/playground/mcp",
@@ -380,7 +375,7 @@ class TestPlaygroundMCP:
         assert "tools" in data["result"]
         assert len(data["result"]["tools"]) >= 1
 
-    def test_mcp_tools_call(self, client: SyncASGIClient, auth_headers: dict):
+    def test_mcp_tools_call(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test MCP tools/call method."""
         response = client.post(
             "/api/playground/mcp",
@@ -403,7 +398,7 @@ class TestPlaygroundMCP:
         assert "content" in data["result"]
         assert data["result"]["isError"] is False
 
-    def test_mcp_tools_call_missing_name(self, client: SyncASGIClient, auth_headers: dict):
+    def test_mcp_tools_call_missing_name(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test MCP tools/call without name returns error."""
         response = client.post(
             "/api/playground/mcp",
@@ -421,7 +416,7 @@ class TestPlaygroundMCP:
         assert "error" in data
         assert data["error"]["code"] == -32602
 
-    def test_mcp_unknown_method(self, client: SyncASGIClient, auth_headers: dict):
+    def test_mcp_unknown_method(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test MCP with unknown method returns error."""
         response = client.post(
             "/api/playground/mcp",
@@ -439,7 +434,7 @@ class TestPlaygroundMCP:
         assert data["error"]["code"] == -32601
         assert "not found" in data["error"]["message"].lower()
 
-    def test_mcp_tool_not_found(self, client: SyncASGIClient, auth_headers: dict):
+    def test_mcp_tool_not_found(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test MCP tools/call with non-existent tool."""
         response = client.post(
             "/api/playground/mcp",
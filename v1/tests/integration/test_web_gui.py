@@ -4,50 +4,139 @@ Integration tests for Backend API.
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from pathlib import Path
+from typing import Callable, Mapping
 
 import pytest
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.registry import ToolRegistry, ToolDefinition, reset_registry
-from app.web.server import create_web_app
-from app.web.routes import tools as tools_routes
-from app.web.routes import folders as folders_routes
-from app.reload import init_reloader, reset_reloader
 from tests.utils.sync_client import SyncASGIClient
 
 
+# Tool module picked up by the reload API tests.
+RELOAD_TOOL_SRC = '''
+from pydantic import BaseModel, ConfigDict, Field
+from app.registry import ToolDefinition, ToolRegistry
+
+class ReloadInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    x: str = Field(default="", description="X")
+
+async def handler(payload): return "reloaded"
+
+def register_tools(registry):
+    registry.register(ToolDefinition(
+        name="reloaded_tool",
+        description="Tool loaded via reload",
+        input_model=ReloadInput,
+        handler=handler,
+    ))
+'''
+
+# Replacement source for the tool file lifecycle test.
+UPDATED_TOOL_SRC = '''
+from pydantic import BaseModel, ConfigDict
+from app.registry import ToolDefinition, ToolRegistry
+
+class TestInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    new_field: str = "updated"
+
+async def handler(payload): return "updated"
+
+def register_tools(registry):
+    registry.register(ToolDefinition(name="test", description="Updated test", input_model=TestInput, handler=handler))
+'''
+
+# Minimal tool module that passes validation.
+VALID_TOOL_SRC = '''
+from pydantic import BaseModel, ConfigDict
+from app.registry import ToolDefinition, ToolRegistry
+
+class TestInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+async def handler(payload): return "test"
+
+def register_tools(registry):
+    registry.register(ToolDefinition(name="test", description="Test", input_model=TestInput, handler=handler))
+'''
+
+# Tool module uploaded into a fresh namespace.
+UPLOAD_TOOL_SRC = """
+from pydantic import BaseModel, ConfigDict
+from app.registry import ToolDefinition
+
+class UploadInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    value: str = "ok"
+
+async def upload_handler(payload: UploadInput):
+    return payload.value
+
+def register_tools(registry):
+    registry.register(ToolDefinition(name="upload_tool", description="Upload", input_model=UploadInput, handler=upload_handler))
+""".strip()
+
+
 # ==================== Fixtures ====================
 
 
-@pytest.fixture
+class WebToolInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    value: str = Field(default="test", description="Test value")
+
+
+async def web_tool_handler(payload: WebToolInput) -> str:
+    return f"Value: {payload.value}"
+
+
+WEB_TEST_TOOL = ToolDefinition(
+    name="web_test_tool",
+    description="Test tool for web GUI",
+    input_model=WebToolInput,
+    handler=web_tool_handler,
+)
+
+
+@pytest.fixture(scope="module")
 def registry() -> ToolRegistry:
-    """Fresh registry with test tools."""
+    """Registry shared by the module's web app; reset per test by ``client``."""
     reset_registry()
     reg = ToolRegistry()
-
-    class TestInput(BaseModel):
-        model_config = ConfigDict(extra="forbid")
-        value: str = Field(default="test", description="Test value")
-
-    async def test_handler(payload: TestInput) -> str:
-        return f"Value: {payload.value}"
-
-    TestInput.model_rebuild(force=True)
-    reg.register(
-        ToolDefinition(
-            name="web_test_tool",
-            description="Test tool for web GUI",
-            input_model=TestInput,
-            handler=test_handler,
-        ),
-        namespace="shared",
-    )
-
+    reg.register(WEB_TEST_TOOL, namespace="shared")
     yield reg
     reset_registry()
 
 
+@pytest.fixture(scope="module")
+def web_app(registry: ToolRegistry, tmp_path_factory: pytest.TempPathFactory):
+    """Web app built once per module."""
+    from app.web.server import create_web_app
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATA_DIR", str(tmp_path_factory.mktemp("web_gui_data")))
+        yield create_web_app(registry)
+
+
+@pytest.fixture(scope="module")
+def module_client(web_app) -> SyncASGIClient:
+    """
+    Client over the module's web app.
+
+    Requests rejected by auth use it directly; everything else goes through
+    ``client``, which resets per-test state first.
+    """
+    client = SyncASGIClient(web_app)
+    try:
+        yield client
+    finally:
+        client.close()
+
+
 @pytest.fixture
 def tools_dir(tmp_path: Path) -> Path:
     """Temporary tools directory."""
@@ -56,34 +145,46 @@ def tools_dir(tmp_path: Path) -> Path:
     return tools.parent
 
 
+@pytest.fixture
+def write_tool(tools_dir: Path) -> Callable[..., Path]:
+    """Factory that writes a tool file into ``tools_dir/<namespace>``."""
+
+    def _write(filename: str, content: str, namespace: str = "shared") -> Path:
+        ns_dir = tools_dir / namespace
+        ns_dir.mkdir(parents=True, exist_ok=True)
+        path = ns_dir / filename
+        path.write_text(content)
+        return path
+
+    return _write
+
+
 @pytest.fixture
 def client(
+    module_client: SyncASGIClient,
     registry: ToolRegistry,
     tools_dir: Path,
     monkeypatch: pytest.MonkeyPatch,
+    request: pytest.FixtureRequest,
 ) -> SyncASGIClient:
-    """Test client with auth enabled."""
-    monkeypatch.setenv("BEARER_TOKEN", "test_token")
-    monkeypatch.setenv("DATA_DIR", str(tools_dir.parent))
+    """Test client with auth enabled and a fresh registry and tools dir."""
+    from app.reload import init_reloader, reset_reloader
 
-    # Initialize reloader
-    reset_reloader()
-    init_reloader(registry, str(tools_dir))
+    monkeypatch.setenv("DATA_DIR", str(tools_dir.parent))
 
-    app = create_web_app(registry)
-    client = SyncASGIClient(app)
-    try:
-        yield client
-    finally:
-        client.close()
+    baseline = registry.snapshot()
 
-    reset_reloader()
+    # Only reload tests need the reloader pointed at this test's tools dir
+    needs_reloader = request.node.get_closest_marker("needs_reloader") is not None
+    if needs_reloader:
+        reset_reloader()
+        init_reloader(registry, str(tools_dir))
 
+    yield module_client
 
-@pytest.fixture
-def auth_headers() -> dict:
-    """Bearer auth headers."""
-    return {"Authorization": "Bearer test_token"}
+    registry.restore(baseline)
+    if needs_reloader:
+        reset_reloader()
 
 
 # ==================== Health Endpoint Tests ====================
@@ -101,11 +202,16 @@ class TestHealthEndpoint:
         assert data["status"] == "healthy"
         assert data["service"] == "backend-api"
 
-    def test_health_includes_stats(self, client: SyncASGIClient):
+    def test_health_includes_stats(self, web_app):
         """Test health includes tool statistics."""
-        response = client.get("/health")
+        # Auth is covered above; call the handler without the middleware stack
+        health = next(
+            route.endpoint
+            for route in web_app.routes
+            if getattr(route, "path", None) == "/health"
+        )
 
-        data = response.json()
+        data = asyncio.run(health())
         assert "tools" in data
         assert data["tools"]["total"] >= 1
 
@@ -144,7 +250,7 @@ class TestDocsEndpoints:
 class TestDashboard:
     """Tests for dashboard API endpoint."""
 
-    def test_dashboard_api(self, client: SyncASGIClient, auth_headers: dict):
+    def test_dashboard_api(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test dashboard API returns overview data."""
         response = client.get("/api/dashboard", headers=auth_headers)
 
@@ -154,12 +260,6 @@ class TestDashboard:
         assert "namespaces" in data
         assert "endpoints" in data
 
-    def test_dashboard_requires_auth(self, client: SyncASGIClient):
-        """Test dashboard requires authentication."""
-        response = client.get("/api/dashboard")
-
-        assert response.status_code == 401
-
 
 # ==================== Folders API Tests ====================
 
@@ -167,30 +267,24 @@ class TestDashboard:
 class TestFoldersAPI:
     """Tests for folders/namespaces API."""
 
-    def test_list_folders(self, client: SyncASGIClient, auth_headers: dict):
+    def test_list_folders(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test listing folders/namespaces."""
         response = client.get("/api/folders", headers=auth_headers)
 
         assert response.status_code == 200
         data = response.json()
         assert "folders" in data
-        folder_names = [f["name"] for f in data["folders"]]
-        assert "shared" in folder_names
-
-    def test_list_folders_requires_auth(self, client: SyncASGIClient):
-        """Test listing folders requires auth."""
-        response = client.get("/api/folders")
-
-        assert response.status_code == 401
+        assert "shared" in {f["name"] for f in data["folders"]}
 
 
 # ==================== Reload API Tests ====================
 
 
+@pytest.mark.needs_reloader
 class TestReloadAPI:
     """Tests for reload API endpoints."""
 
-    def test_reload_status(self, client: SyncASGIClient, auth_headers: dict):
+    def test_reload_status(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test getting reload status."""
         response = client.get("/api/reload/status", headers=auth_headers)
 
@@ -199,7 +293,7 @@ class TestReloadAPI:
         assert data["enabled"] is True
         assert "namespaces" in data
 
-    def test_reload_all(self, client: SyncASGIClient, auth_headers: dict):
+    def test_reload_all(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test reloading all namespaces."""
         response = client.post("/api/reload", headers=auth_headers)
 
@@ -211,33 +305,11 @@ class TestReloadAPI:
     def test_reload_namespace(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
-        tools_dir: Path,
+        auth_headers: Mapping[str, str],
+        write_tool: Callable[..., Path],
     ):
         """Test reloading a specific namespace."""
-        shared_dir = tools_dir / "shared"
-        shared_dir.mkdir(exist_ok=True)
-
-        tool_code = '''
-from pydantic import BaseModel, ConfigDict, Field
-from app.registry import ToolDefinition, ToolRegistry
-
-class ReloadInput(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-    x: str = Field(default="", description="X")
-
-async def handler(payload): return "reloaded"
-
-def register_tools(registry):
-    ReloadInput.model_rebuild(force=True)
-    registry.register(ToolDefinition(
-        name="reloaded_tool",
-        description="Tool loaded via reload",
-        input_model=ReloadInput,
-        handler=handler,
-    ))
-'''
-        (shared_dir / "reload_test.py").write_text(tool_code)
+        write_tool("reload_test.py", RELOAD_TOOL_SRC)
 
         response = client.post("/api/reload/shared", headers=auth_headers)
 
@@ -246,7 +318,7 @@ def register_tools(registry):
         assert data["success"] is True
 
     def test_reload_invalid_namespace(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test reloading invalid namespace returns error."""
         response = client.post(
@@ -255,12 +327,6 @@ def register_tools(registry):
 
         assert response.status_code == 400
 
-    def test_reload_requires_auth(self, client: SyncASGIClient):
-        """Test reload requires authentication."""
-        response = client.post("/api/reload")
-
-        assert response.status_code == 401
-
 
 # ==================== Tools API Tests ====================
 
@@ -268,7 +334,7 @@ def register_tools(registry):
 class TestToolsAPI:
     """Tests for tools API endpoints."""
 
-    def test_list_tools(self, client: SyncASGIClient, auth_headers: dict):
+    def test_list_tools(self, client: SyncASGIClient, auth_headers: Mapping[str, str]):
         """Test listing tools in a namespace."""
         response = client.get("/api/folders/shared/files", headers=auth_headers)
 
@@ -277,14 +343,8 @@ class TestToolsAPI:
         assert "tools" in data
         assert data["namespace"] == "shared"
 
-    def test_list_tools_requires_auth(self, client: SyncASGIClient):
-        """Test listing tools requires auth."""
-        response = client.get("/api/folders/shared/files")
-
-        assert response.status_code == 401
-
     def test_list_tools_nonexistent_namespace(
-        self, client: SyncASGIClient, auth_headers: dict
+        self, client: SyncASGIClient, auth_headers: Mapping[str, str]
     ):
         """Test listing tools in nonexistent namespace."""
         response = client.get(
@@ -298,28 +358,43 @@ class TestToolsAPI:
 
 
 class TestSecurity:
-    """Security-related tests."""
-
-    def test_invalid_bearer_token(self, client: SyncASGIClient):
-        """Test invalid bearer token is rejected."""
-        response = client.get(
-            "/api/folders",
-            headers={"Authorization": "Bearer wrong_token"},
-        )
-
-        assert response.status_code == 401
-
-    def test_missing_auth_header(self, client: SyncASGIClient):
-        """Test missing auth header is rejected."""
-        response = client.get("/api/folders")
+    """Requests without valid credentials are rejected before reaching routes."""
+
+    @pytest.mark.parametrize(
+        "method,path,kwargs",
+        [
+            ("GET", "/api/dashboard", {}),
+            ("GET", "/api/folders", {}),
+            ("POST", "/api/reload", {}),
+            ("GET", "/api/folders/shared/files", {}),
+            (
+                "POST",
+                "/api/folders/shared/files/create-from-template",
+                {"json": {"name": "test_tool"}},
+            ),
+        ],
+        ids=["dashboard", "list_folders", "reload", "list_tools", "create_tool"],
+    )
+    def test_requires_auth(
+        self, module_client: SyncASGIClient, method: str, path: str, kwargs: dict
+    ):
+        """Test protected endpoints reject requests without an auth header."""
+        response = module_client.request(method, path, **kwargs)
 
         assert response.status_code == 401
 
-    def test_malformed_auth_header(self, client: SyncASGIClient):
-        """Test malformed auth header is rejected."""
-        response = client.get(
+    @pytest.mark.parametrize(
+        "authorization",
+        ["Bearer wrong_token", "InvalidFormat token", "Basic YWRtaW46dGVzdF90b2tlbg=="],
+        ids=["invalid_bearer_token", "malformed_auth_header", "basic_auth"],
+    )
+    def test_bad_credentials_rejected(
+        self, module_client: SyncASGIClient, authorization: str
+    ):
+        """Test invalid, malformed or non-bearer auth headers are rejected."""
+        response = module_client.get(
             "/api/folders",
-            headers={"Authorization": "InvalidFormat token"},
+            headers={"Authorization": authorization},
         )
 
         assert response.status_code == 401
@@ -331,43 +406,10 @@ class TestSecurity:
 class TestCreateToolFromTemplate:
     """Tests for create-from-template API endpoint."""
 
-    def test_create_tool_from_template(
-        self,
-        client: SyncASGIClient,
-        auth_headers: dict,
-        tools_dir: Path,
-    ):
-        """Test creating a new tool from template."""
-        # Ensure shared directory exists
-        shared_dir = tools_dir / "shared"
-        shared_dir.mkdir(exist_ok=True)
-
-        response = client.post(
-            "/api/folders/shared/files/create-from-template",
-            headers=auth_headers,
-            json={"name": "my_new_tool"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert data["filename"] == "my_new_tool.py"
-        assert "my_new_tool.py" in data["path"]
-
-        # Verify file was created
-        tool_file = tools_dir / "shared" / "my_new_tool.py"
-        assert tool_file.exists()
-
-        # Verify content has correct class name
-        content = tool_file.read_text()
-        assert "class MyNewToolInput" in content
-        assert "async def my_new_tool_handler" in content
-        assert 'name="my_new_tool"' in content
-
     def test_create_tool_requires_snake_case(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         """Test tool name must be snake_case."""
         response = client.post(
@@ -382,7 +424,7 @@ class TestCreateToolFromTemplate:
     def test_create_tool_rejects_invalid_chars(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         """Test tool name rejects invalid characters."""
         response = client.post(
@@ -396,14 +438,11 @@ class TestCreateToolFromTemplate:
     def test_create_tool_rejects_existing(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
-        tools_dir: Path,
+        auth_headers: Mapping[str, str],
+        write_tool: Callable[..., Path],
     ):
         """Test cannot create tool with existing name."""
-        # Create existing file
-        shared_dir = tools_dir / "shared"
-        shared_dir.mkdir(exist_ok=True)
-        (shared_dir / "existing_tool.py").write_text("# existing")
+        write_tool("existing_tool.py", "# existing")
 
         response = client.post(
             "/api/folders/shared/files/create-from-template",
@@ -414,19 +453,10 @@ class TestCreateToolFromTemplate:
         assert response.status_code == 400
         assert "already exists" in response.json()["detail"]
 
-    def test_create_tool_requires_auth(self, client: SyncASGIClient):
-        """Test create-from-template requires authentication."""
-        response = client.post(
-            "/api/folders/shared/files/create-from-template",
-            json={"name": "test_tool"},
-        )
-
-        assert response.status_code == 401
-
     def test_create_tool_nonexistent_namespace(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         """Test creating tool in nonexistent namespace."""
         response = client.post(
@@ -444,53 +474,12 @@ class TestCreateToolFromTemplate:
 class TestGetTool:
     """Tests for GET /api/folders/{namespace}/files/{filename} endpoint."""
 
-    def test_get_tool_success(
-        self,
-        client: SyncASGIClient,
-        auth_headers: dict,
-        tools_dir: Path,
-    ):
-        """Test getting a tool file."""
-        shared_dir = tools_dir / "shared"
-        shared_dir.mkdir(exist_ok=True)
-
-        tool_content = '''
-from pydantic import BaseModel, ConfigDict
-from app.registry import ToolDefinition, ToolRegistry
-
-class TestInput(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-    value: str = ""
-
-async def handler(payload): return "test"
-
-def register_tools(registry):
-    registry.register(ToolDefinition(name="test", description="Test", input_model=TestInput, handler=handler))
-'''
-        (shared_dir / "test_tool.py").write_text(tool_content)
-
-        response = client.get(
-            "/api/folders/shared/files/test_tool.py",
-            headers=auth_headers,
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["filename"] == "test_tool.py"
-        assert data["namespace"] == "shared"
-        assert "content" in data
-        assert "validation" in data
-
     def test_get_tool_not_found(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
-        tools_dir: Path,
+        auth_headers: Mapping[str, str],
     ):
         """Test getting non-existent tool."""
-        shared_dir = tools_dir / "shared"
-        shared_dir.mkdir(exist_ok=True)
-
         response = client.get(
             "/api/folders/shared/files/nonexistent.py",
             headers=auth_headers,
@@ -498,36 +487,30 @@ def register_tools(registry):
 
         assert response.status_code == 404
 
+    @pytest.mark.parametrize(
+        "attempt",
+        ["../secret.py", "..%2Fsecret.py", "test/../secret.py"],
+        ids=["dotdot", "encoded_slash", "nested_dotdot"],
+    )
     def test_get_tool_path_traversal(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
-        tools_dir: Path,
+        auth_headers: Mapping[str, str],
+        attempt: str,
     ):
         """Test path traversal is blocked."""
-        shared_dir = tools_dir / "shared"
-        shared_dir.mkdir(exist_ok=True)
-
-        # Try various path traversal attempts in filename
-        traversal_attempts = [
-            "../secret.py",
-            "..%2Fsecret.py",
-            "test/../secret.py",
-        ]
-
-        for attempt in traversal_attempts:
-            response = client.get(
-                f"/api/folders/shared/files/{attempt}",
-                headers=auth_headers,
-            )
-            # Should be blocked - either as invalid filename (400) or not found (404)
-            # The important thing is it doesn't return 200 or leak information
-            assert response.status_code in (400, 404), f"Path traversal not blocked: {attempt}"
+        response = client.get(
+            f"/api/folders/shared/files/{attempt}",
+            headers=auth_headers,
+        )
+        # Should be blocked - either as invalid filename (400) or not found (404)
+        # The important thing is it doesn't return 200 or leak information
+        assert response.status_code in (400, 404)
 
     def test_get_tool_invalid_filename(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         """Test invalid filename is rejected."""
         response = client.get(
@@ -544,68 +527,12 @@ def register_tools(registry):
 class TestUpdateTool:
     """Tests for PUT /api/folders/{namespace}/files/{filename} endpoint."""
 
-    def test_update_tool_success(
-        self,
-        client: SyncASGIClient,
-        auth_headers: dict,
-        tools_dir: Path,
-    ):
-        """Test updating a tool file."""
-        shared_dir = tools_dir / "shared"
-        shared_dir.mkdir(exist_ok=True)
-
-        original_content = '''
-from pydantic import BaseModel, ConfigDict
-from app.registry import ToolDefinition, ToolRegistry
-
-class TestInput(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-
-async def handler(payload): return "original"
-
-def register_tools(registry):
-    registry.register(ToolDefinition(name="test", description="Test", input_model=TestInput, handler=handler))
-'''
-        (shared_dir / "update_test.py").write_text(original_content)
-
-        new_content = '''
-from pydantic import BaseModel, ConfigDict
-from app.registry import ToolDefinition, ToolRegistry
-
-class TestInput(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-    new_field: str = "updated"
-
-async def handler(payload): return "updated"
-
-def register_tools(registry):
-    registry.register(ToolDefinition(name="test", description="Updated test", input_model=TestInput, handler=handler))
-'''
-
-        response = client.put(
-            "/api/folders/shared/files/update_test.py",
-            headers=auth_headers,
-            json={"content": new_content, "skip_validation": False},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-
-        # Verify file was updated
-        updated_content = (shared_dir / "update_test.py").read_text()
-        assert "updated" in updated_content
-
     def test_update_tool_not_found(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
-        tools_dir: Path,
+        auth_headers: Mapping[str, str],
     ):
         """Test updating non-existent tool."""
-        shared_dir = tools_dir / "shared"
-        shared_dir.mkdir(exist_ok=True)
-
         response = client.put(
             "/api/folders/shared/files/nonexistent.py",
             headers=auth_headers,
@@ -617,13 +544,11 @@ def register_tools(registry):
     def test_update_tool_validation_failure(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
-        tools_dir: Path,
+        auth_headers: Mapping[str, str],
+        write_tool: Callable[..., Path],
     ):
         """Test updating with invalid content fails validation."""
-        shared_dir = tools_dir / "shared"
-        shared_dir.mkdir(exist_ok=True)
-        (shared_dir / "validate_test.py").write_text("# original")
+        write_tool("validate_test.py", "# original")
 
         invalid_content = "def broken syntax("
 
@@ -641,7 +566,7 @@ def register_tools(registry):
     def test_update_requires_valid_json(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         """Test update requires valid JSON body."""
         response = client.put(
@@ -659,48 +584,87 @@ def register_tools(registry):
 class TestDeleteTool:
     """Tests for DELETE /api/folders/{namespace}/files/{filename} endpoint."""
 
-    def test_delete_tool_success(
+    def test_delete_tool_not_found(
+        self,
+        client: SyncASGIClient,
+        auth_headers: Mapping[str, str],
+    ):
+        """Test deleting non-existent tool."""
+        response = client.delete(
+            "/api/folders/shared/files/nonexistent.py",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 404
+
+
+# ==================== Tool File Lifecycle Tests ====================
+
+
+class TestToolFileLifecycle:
+    """Tests for creating, reading, updating and deleting one tool file."""
+
+    def test_tool_file_lifecycle(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
         tools_dir: Path,
     ):
-        """Test deleting a tool file."""
-        shared_dir = tools_dir / "shared"
-        shared_dir.mkdir(exist_ok=True)
-        tool_file = shared_dir / "to_delete.py"
-        tool_file.write_text("# delete me")
+        """Test create-from-template, get, update and delete on the same tool."""
+        # Create from template
+        response = client.post(
+            "/api/folders/shared/files/create-from-template",
+            headers=auth_headers,
+            json={"name": "my_new_tool"},
+        )
 
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["filename"] == "my_new_tool.py"
+        assert "my_new_tool.py" in data["path"]
+
+        tool_file = tools_dir / "shared" / "my_new_tool.py"
         assert tool_file.exists()
 
-        response = client.delete(
-            "/api/folders/shared/files/to_delete.py",
+        content = tool_file.read_text()
+        assert "class MyNewToolInput" in content
+        assert "async def my_new_tool_handler" in content
+        assert 'name="my_new_tool"' in content
+
+        # Get
+        response = client.get(
+            "/api/folders/shared/files/my_new_tool.py",
             headers=auth_headers,
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["success"] is True
+        assert data["filename"] == "my_new_tool.py"
+        assert data["namespace"] == "shared"
+        assert "content" in data
+        assert "validation" in data
 
-        # Verify file was deleted
-        assert not tool_file.exists()
+        # Update
+        response = client.put(
+            "/api/folders/shared/files/my_new_tool.py",
+            headers=auth_headers,
+            json={"content": UPDATED_TOOL_SRC, "skip_validation": False},
+        )
 
-    def test_delete_tool_not_found(
-        self,
-        client: SyncASGIClient,
-        auth_headers: dict,
-        tools_dir: Path,
-    ):
-        """Test deleting non-existent tool."""
-        shared_dir = tools_dir / "shared"
-        shared_dir.mkdir(exist_ok=True)
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+        assert "updated" in tool_file.read_text()
 
+        # Delete
         response = client.delete(
-            "/api/folders/shared/files/nonexistent.py",
+            "/api/folders/shared/files/my_new_tool.py",
             headers=auth_headers,
         )
 
-        assert response.status_code == 404
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+        assert not tool_file.exists()
 
 
 # ==================== Validate Tool Tests ====================
@@ -712,25 +676,13 @@ class TestValidateTool:
     def test_validate_valid_tool(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         """Test validating a valid tool file."""
-        valid_content = '''
-from pydantic import BaseModel, ConfigDict
-from app.registry import ToolDefinition, ToolRegistry
-
-class TestInput(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-
-async def handler(payload): return "test"
-
-def register_tools(registry):
-    registry.register(ToolDefinition(name="test", description="Test", input_model=TestInput, handler=handler))
-'''
         response = client.post(
             "/api/folders/shared/files/validate",
             headers=auth_headers,
-            files={"file": ("test.py", valid_content, "text/plain")},
+            files={"file": ("test.py", VALID_TOOL_SRC, "text/plain")},
         )
 
         assert response.status_code == 200
@@ -740,7 +692,7 @@ def register_tools(registry):
     def test_validate_invalid_tool(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         """Test validating an invalid tool file."""
         invalid_content = "def broken("
@@ -763,30 +715,16 @@ class TestUploadTool:
     def test_upload_tool_success(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
         tools_dir: Path,
     ):
         ns = "upload_ns"
         (tools_dir / ns).mkdir(parents=True, exist_ok=True)
-        content = """
-from pydantic import BaseModel, ConfigDict
-from app.registry import ToolDefinition
-
-class UploadInput(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-    value: str = "ok"
-
-async def upload_handler(payload: UploadInput):
-    return payload.value
-
-def register_tools(registry):
-    registry.register(ToolDefinition(name="upload_tool", description="Upload", input_model=UploadInput, handler=upload_handler))
-""".strip()
 
         response = client.post(
             f"/api/folders/{ns}/files",
             headers=auth_headers,
-            files={"file": ("upload_tool.py", content, "text/plain")},
+            files={"file": ("upload_tool.py", UPLOAD_TOOL_SRC, "text/plain")},
         )
 
         assert response.status_code == 200
@@ -798,7 +736,7 @@ def register_tools(registry):
     def test_upload_tool_missing_namespace(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         response = client.post(
             "/api/folders/missing_ns/files",
@@ -814,10 +752,12 @@ class TestDependenciesAPI:
     def test_dependencies_lifecycle(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
         tools_dir: Path,
         monkeypatch: pytest.MonkeyPatch,
     ):
+        from app.web.routes import tools as tools_routes
+
         ns = "deps_ns"
         (tools_dir / ns).mkdir(parents=True, exist_ok=True)
         fake_venv = tools_dir.parent / "venvs" / ns
@@ -828,7 +768,12 @@ class TestDependenciesAPI:
         monkeypatch.setattr(tools_routes, "read_requirements", lambda namespace: "httpx==0.28.1\n")
         monkeypatch.setattr(tools_routes, "list_packages", lambda namespace: [{"name": "httpx", "version": "0.28.1"}])
         monkeypatch.setattr(tools_routes, "ensure_venv", lambda namespace: fake_venv)
-        monkeypatch.setattr(tools_routes, "delete_venv", lambda namespace: True)
+        delete_threads = []
+        monkeypatch.setattr(
+            tools_routes,
+            "delete_venv",
+            lambda namespace: delete_threads.append(threading.get_ident()) or True,
+        )
         monkeypatch.setattr(
             tools_routes,
             "install_requirements",
@@ -867,11 +812,13 @@ class TestDependenciesAPI:
         response = client.post(f"/api/folders/{ns}/files/deps/delete", headers=auth_headers)
         assert response.status_code == 200
         assert response.json()["deleted"] is True
+        # The venv rmtree runs in a worker thread, not on the event loop
+        assert delete_threads and delete_threads[0] != threading.get_ident()
 
     def test_dependencies_install_requires_requirements(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
         tools_dir: Path,
     ):
         ns = "deps_req"
@@ -895,7 +842,7 @@ class TestFoldersCRUD:
     def test_create_folder(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         """Test creating a new folder."""
         response = client.post(
@@ -912,11 +859,13 @@ class TestFoldersCRUD:
     def test_create_folder_rolls_back_when_venv_creation_fails(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
         monkeypatch: pytest.MonkeyPatch,
         tools_dir: Path,
     ):
         """Folder creation cleans up partial state when venv creation fails."""
+        from app.web.routes import folders as folders_routes
+
         namespace = "broken_ns"
 
         def _raise_venv_error(_: str):
@@ -937,7 +886,7 @@ class TestFoldersCRUD:
     def test_create_folder_reserved_name(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         """Test creating folder with reserved name fails."""
         response = client.post(
@@ -952,7 +901,7 @@ class TestFoldersCRUD:
     def test_create_folder_duplicate(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         """Test creating duplicate folder fails."""
         # Create first
@@ -974,15 +923,13 @@ class TestFoldersCRUD:
     def test_get_folder(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
-        tools_dir: Path,
+        auth_headers: Mapping[str, str],
+        write_tool: Callable[..., Path],
     ):
         """Test getting folder info."""
         # Create folder with tools
-        test_dir = tools_dir / "test_ns"
-        test_dir.mkdir(parents=True)
-        (test_dir / "tool1.py").write_text("# tool1")
-        (test_dir / "tool2.py").write_text("# tool2")
+        write_tool("tool1.py", "# tool1", namespace="test_ns")
+        write_tool("tool2.py", "# tool2", namespace="test_ns")
 
         response = client.get("/api/folders/test_ns", headers=auth_headers)
 
@@ -994,7 +941,7 @@ class TestFoldersCRUD:
     def test_get_folder_not_found(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         """Test getting non-existent folder."""
         response = client.get("/api/folders/nonexistent", headers=auth_headers)
@@ -1004,10 +951,20 @@ class TestFoldersCRUD:
     def test_delete_folder_empty(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
         tools_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """Test deleting empty folder."""
+        from app.web.routes import folders as folders_routes
+
+        delete_threads = []
+        monkeypatch.setattr(
+            folders_routes,
+            "delete_venv",
+            lambda namespace: delete_threads.append(threading.get_ident()) or False,
+        )
+
         # Create empty folder
         test_dir = tools_dir / "to_delete"
         test_dir.mkdir(parents=True)
@@ -1019,18 +976,18 @@ class TestFoldersCRUD:
 
         assert response.status_code == 200
         assert not test_dir.exists()
+        # The venv rmtree runs in a worker thread, not on the event loop
+        assert delete_threads and delete_threads[0] != threading.get_ident()
 
     def test_delete_folder_with_tools_requires_force(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
-        tools_dir: Path,
+        auth_headers: Mapping[str, str],
+        write_tool: Callable[..., Path],
     ):
         """Test deleting folder with tools requires force flag."""
         # Create folder with tool
-        test_dir = tools_dir / "has_tools"
-        test_dir.mkdir(parents=True)
-        (test_dir / "tool.py").write_text("# tool")
+        test_dir = write_tool("tool.py", "# tool", namespace="has_tools").parent
 
         response = client.delete(
             "/api/folders/has_tools",
@@ -1052,7 +1009,7 @@ class TestFoldersCRUD:
     def test_delete_reserved_folder(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
     ):
         """Test deleting reserved folder fails."""
         response = client.delete(
@@ -1066,7 +1023,7 @@ class TestFoldersCRUD:
     def test_namespace_info(
         self,
         client: SyncASGIClient,
-        auth_headers: dict,
+        auth_headers: Mapping[str, str],
         tools_dir: Path,
     ):
         """Test namespace info includes correct endpoint."""
@@ -10,8 +10,10 @@ import pytest
 import httpx
 from fastapi import HTTPException
 from fastapi import FastAPI
+from fastapi.security import HTTPBasicCredentials
 
 from app.auth import (
+    _bearer_header_matches,
     _constant_time_compare,
     get_bearer_token,
     is_auth_enabled,
@@ -23,6 +25,15 @@ from app.auth import (
     ADMIN_USERNAME,
 )
 
+# Basic auth headers for the middleware tests, encoded once at import
+VALID_BASIC_AUTH = "Basic " + base64.b64encode(b"admin:my_password").decode("utf-8")
+WRONG_BASIC_AUTH = "Basic " + base64.b64encode(b"admin:wrong_password").decode("utf-8")
+
+# Basic credentials for the dependency tests, built once and shared
+ADMIN_CREDENTIALS = HTTPBasicCredentials(username="admin", password="my_password")
+WRONG_USER_CREDENTIALS = HTTPBasicCredentials(username="wrong_user", password="my_password")
+WRONG_PASSWORD_CREDENTIALS = HTTPBasicCredentials(username="admin", password="wrong_password")
+
 
 # ==================== Constant Time Compare Tests ====================
 
@@ -52,6 +63,26 @@ class TestConstantTimeCompare:
         assert _constant_time_compare("tökën", "token") is False
 
 
+class TestBearerHeaderMatches:
+    """Tests for _bearer_header_matches function."""
+
+    def test_canonical_header(self):
+        """Test the exact 'Bearer <token>' form matches."""
+        assert _bearer_header_matches("Bearer secret", "secret") is True
+
+    def test_lenient_spellings(self):
+        """Test lowercase scheme and padded tokens still match."""
+        assert _bearer_header_matches("bearer secret", "secret") is True
+        assert _bearer_header_matches("Bearer  secret ", "secret") is True
+
+    def test_mismatches(self):
+        """Test wrong tokens, schemes and empty headers are rejected."""
+        assert _bearer_header_matches("Bearer wrong", "secret") is False
+        assert _bearer_header_matches("secret", "secret") is False
+        assert _bearer_header_matches("Basic secret", "secret") is False
+        assert _bearer_header_matches("", "secret") is False
+
+
 # ==================== Auth Configuration Tests ====================
 
 
@@ -161,12 +192,7 @@ class TestVerifyBasicAuth:
         """Test valid basic auth credentials are accepted."""
         monkeypatch.setenv("BEARER_TOKEN", "my_password")
 
-        # Create mock credentials
-        from fastapi.security import HTTPBasicCredentials
-
-        credentials = HTTPBasicCredentials(username="admin", password="my_password")
-
-        result = await verify_basic_auth(credentials)
+        result = await verify_basic_auth(ADMIN_CREDENTIALS)
 
         assert result == "admin"
 
@@ -175,12 +201,8 @@ class TestVerifyBasicAuth:
         """Test invalid username is rejected."""
         monkeypatch.setenv("BEARER_TOKEN", "my_password")
 
-        from fastapi.security import HTTPBasicCredentials
-
-        credentials = HTTPBasicCredentials(username="wrong_user", password="my_password")
-
         with pytest.raises(HTTPException) as exc_info:
-            await verify_basic_auth(credentials)
+            await verify_basic_auth(WRONG_USER_CREDENTIALS)
 
         assert exc_info.value.status_code == 401
 
@@ -189,12 +211,8 @@ class TestVerifyBasicAuth:
         """Test invalid password is rejected."""
         monkeypatch.setenv("BEARER_TOKEN", "correct_password")
 
-        from fastapi.security import HTTPBasicCredentials
-
-        credentials = HTTPBasicCredentials(username="admin", password="wrong_password")
-
         with pytest.raises(HTTPException) as exc_info:
-            await verify_basic_auth(credentials)
+            await verify_basic_auth(WRONG_PASSWORD_CREDENTIALS)
 
         assert exc_info.value.status_code == 401
 
@@ -240,11 +258,7 @@ class TestVerifyTokenOrBasic:
         """Test that basic auth is accepted."""
         monkeypatch.setenv("BEARER_TOKEN", "my_password")
 
-        from fastapi.security import HTTPBasicCredentials
-
-        credentials = HTTPBasicCredentials(username="admin", password="my_password")
-
-        result = await verify_token_or_basic(None, credentials)
+        result = await verify_token_or_basic(None, ADMIN_CREDENTIALS)
 
         assert result == "admin"
 
@@ -253,12 +267,8 @@ class TestVerifyTokenOrBasic:
         """Test that bearer token takes precedence over basic auth."""
         monkeypatch.setenv("BEARER_TOKEN", "my_token")
 
-        from fastapi.security import HTTPBasicCredentials
-
         # Provide both (basic auth has different password)
-        credentials = HTTPBasicCredentials(username="admin", password="different")
-
-        result = await verify_token_or_basic("Bearer my_token", credentials)
+        result = await verify_token_or_basic("Bearer my_token", ADMIN_CREDENTIALS)
 
         assert result == "bearer-auth"
 
@@ -267,12 +277,8 @@ class TestVerifyTokenOrBasic:
         """Test that invalid credentials for both methods are rejected."""
         monkeypatch.setenv("BEARER_TOKEN", "correct_token")
 
-        from fastapi.security import HTTPBasicCredentials
-
-        credentials = HTTPBasicCredentials(username="admin", password="wrong")
-
         with pytest.raises(HTTPException) as exc_info:
-            await verify_token_or_basic("Bearer wrong_token", credentials)
+            await verify_token_or_basic("Bearer wrong_token", WRONG_PASSWORD_CREDENTIALS)
 
         assert exc_info.value.status_code == 401
 
@@ -280,27 +286,57 @@ class TestVerifyTokenOrBasic:
 # ==================== Middleware Tests ====================
 
 
+@pytest.fixture(scope="module")
+def app_factory():
+    """Return a builder for small apps wrapped in an auth middleware.
+
+    Apps are cached per middleware configuration. The middlewares read
+    BEARER_TOKEN per request, so tests can share an app and still set their
+    own token.
+    """
+    apps = {}
+
+    def build(middleware, public_paths=frozenset(), bearer_paths=None):
+        key = (middleware, frozenset(public_paths), frozenset(bearer_paths or ()))
+        if key not in apps:
+            app = FastAPI()
+            options = {"public_paths": set(public_paths)}
+            if bearer_paths is not None:
+                options["bearer_paths"] = set(bearer_paths)
+            app.add_middleware(middleware, **options)
+
+            @app.get("/health")
+            async def health():
+                return {"status": "ok"}
+
+            @app.get("/protected")
+            async def protected():
+                return {"data": "secret"}
+
+            @app.get("/api/data")
+            async def api_data():
+                return {"data": "from api"}
+
+            apps[key] = app
+        return apps[key]
+
+    return build
+
+
+def _client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
 class TestBearerAuthMiddleware:
     """Tests for BearerAuthMiddleware."""
 
     @pytest.mark.asyncio
-    async def test_allows_public_paths(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_allows_public_paths(self, monkeypatch: pytest.MonkeyPatch, app_factory):
         """Test that public paths don't require auth."""
         monkeypatch.setenv("BEARER_TOKEN", "secret")
 
-        app = FastAPI()
-        app.add_middleware(BearerAuthMiddleware, public_paths={"/health"})
-
-        @app.get("/health")
-        async def health():
-            return {"status": "ok"}
-
-        @app.get("/protected")
-        async def protected():
-            return {"data": "secret"}
-
-        transport = httpx.ASGITransport(app=app)
-        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        app = app_factory(BearerAuthMiddleware, public_paths={"/health"})
+        async with _client(app) as client:
             # Public path should work without auth
             response = await client.get("/health")
             assert response.status_code == 200
@@ -310,57 +346,35 @@ class TestBearerAuthMiddleware:
             assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_allows_valid_bearer_token(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_allows_valid_bearer_token(self, monkeypatch: pytest.MonkeyPatch, app_factory):
         """Test that valid bearer token grants access."""
         monkeypatch.setenv("BEARER_TOKEN", "valid_token")
 
-        app = FastAPI()
-        app.add_middleware(BearerAuthMiddleware, public_paths=set())
-
-        @app.get("/protected")
-        async def protected():
-            return {"data": "secret"}
-
-        transport = httpx.ASGITransport(app=app)
-        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        async with _client(app_factory(BearerAuthMiddleware)) as client:
             response = await client.get(
                 "/protected", headers={"Authorization": "Bearer valid_token"}
             )
             assert response.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_rejects_invalid_bearer_token(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_rejects_invalid_bearer_token(
+        self, monkeypatch: pytest.MonkeyPatch, app_factory
+    ):
         """Test that invalid bearer token is rejected."""
         monkeypatch.setenv("BEARER_TOKEN", "valid_token")
 
-        app = FastAPI()
-        app.add_middleware(BearerAuthMiddleware, public_paths=set())
-
-        @app.get("/protected")
-        async def protected():
-            return {"data": "secret"}
-
-        transport = httpx.ASGITransport(app=app)
-        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        async with _client(app_factory(BearerAuthMiddleware)) as client:
             response = await client.get(
                 "/protected", headers={"Authorization": "Bearer wrong_token"}
             )
             assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_no_auth_when_disabled(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_no_auth_when_disabled(self, monkeypatch: pytest.MonkeyPatch, app_factory):
         """Test that auth is skipped when BEARER_TOKEN is not set."""
         monkeypatch.delenv("BEARER_TOKEN", raising=False)
 
-        app = FastAPI()
-        app.add_middleware(BearerAuthMiddleware, public_paths=set())
-
-        @app.get("/protected")
-        async def protected():
-            return {"data": "secret"}
-
-        transport = httpx.ASGITransport(app=app)
-        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        async with _client(app_factory(BearerAuthMiddleware)) as client:
             # Should work without auth header
             response = await client.get("/protected")
             assert response.status_code == 200
@@ -370,84 +384,49 @@ class TestBasicAuthMiddleware:
     """Tests for BasicAuthMiddleware."""
 
     @pytest.mark.asyncio
-    async def test_allows_public_paths(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_allows_public_paths(self, monkeypatch: pytest.MonkeyPatch, app_factory):
         """Test that public paths don't require auth."""
         monkeypatch.setenv("BEARER_TOKEN", "secret")
 
-        app = FastAPI()
-        app.add_middleware(BasicAuthMiddleware, public_paths={"/health"})
-
-        @app.get("/health")
-        async def health():
-            return {"status": "ok"}
-
-        transport = httpx.ASGITransport(app=app)
-        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        app = app_factory(BasicAuthMiddleware, public_paths={"/health"})
+        async with _client(app) as client:
             response = await client.get("/health")
             assert response.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_allows_valid_basic_auth(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_allows_valid_basic_auth(self, monkeypatch: pytest.MonkeyPatch, app_factory):
         """Test that valid basic auth grants access."""
         monkeypatch.setenv("BEARER_TOKEN", "my_password")
 
-        app = FastAPI()
-        app.add_middleware(BasicAuthMiddleware, public_paths=set())
-
-        @app.get("/protected")
-        async def protected():
-            return {"data": "secret"}
-
-        transport = httpx.ASGITransport(app=app)
-        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
-            # Encode credentials
-            credentials = base64.b64encode(b"admin:my_password").decode("utf-8")
-
+        async with _client(app_factory(BasicAuthMiddleware)) as client:
             response = await client.get(
-                "/protected", headers={"Authorization": f"Basic {credentials}"}
+                "/protected", headers={"Authorization": VALID_BASIC_AUTH}
             )
             assert response.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_allows_bearer_on_api_paths(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_allows_bearer_on_api_paths(
+        self, monkeypatch: pytest.MonkeyPatch, app_factory
+    ):
         """Test that bearer token works on /api/* paths."""
         monkeypatch.setenv("BEARER_TOKEN", "my_token")
 
-        app = FastAPI()
-        app.add_middleware(
-            BasicAuthMiddleware,
-            public_paths=set(),
-            bearer_paths={"/api/"},
-        )
-
-        @app.get("/api/data")
-        async def api_data():
-            return {"data": "from api"}
-
-        transport = httpx.ASGITransport(app=app)
-        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        app = app_factory(BasicAuthMiddleware, bearer_paths={"/api/"})
+        async with _client(app) as client:
             response = await client.get(
                 "/api/data", headers={"Authorization": "Bearer my_token"}
             )
             assert response.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_rejects_invalid_credentials(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_rejects_invalid_credentials(
+        self, monkeypatch: pytest.MonkeyPatch, app_factory
+    ):
         """Test that invalid credentials are rejected."""
         monkeypatch.setenv("BEARER_TOKEN", "correct_password")
 
-        app = FastAPI()
-        app.add_middleware(BasicAuthMiddleware, public_paths=set())
-
-        @app.get("/protected")
-        async def protected():
-            return {"data": "secret"}
-
-        credentials = base64.b64encode(b"admin:wrong_password").decode("utf-8")
-
-        transport = httpx.ASGITransport(app=app)
-        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        async with _client(app_factory(BasicAuthMiddleware)) as client:
             response = await client.get(
-                "/protected", headers={"Authorization": f"Basic {credentials}"}
+                "/protected", headers={"Authorization": WRONG_BASIC_AUTH}
             )
             assert response.status_code == 401
@@ -7,6 +7,26 @@ import pytest
 from app import deps
 
 
+@pytest.fixture
+def patched_venv(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Fake "shared" venv with ensure_venv and subprocess.run stubbed out."""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    venv_dir = tmp_path / "venvs" / "shared"
+    (venv_dir / "bin").mkdir(parents=True)
+    (venv_dir / "bin" / "python").write_text("")
+
+    def fake_run(cmd, check, capture_output):
+        class Result:
+            returncode = 0
+            stdout = b"ok"
+            stderr = b""
+        return Result()
+
+    monkeypatch.setattr(deps, "ensure_venv", lambda namespace: venv_dir)
+    monkeypatch.setattr(deps.subprocess, "run", fake_run)
+    return venv_dir
+
+
 def test_get_venv_dir_uses_data_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     monkeypatch.setenv("DATA_DIR", str(tmp_path))
     assert deps.get_venv_dir("team1") == tmp_path / "venvs" / "team1"
@@ -24,27 +44,16 @@ def test_install_packages_validates_specs(monkeypatch: pytest.MonkeyPatch):
         deps.install_packages("shared", ["bad package"])
 
 
-def test_install_packages_calls_subprocess(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
-    monkeypatch.setenv("DATA_DIR", str(tmp_path))
-
-    def fake_run(cmd, check, capture_output, text):
-        class Result:
-            returncode = 0
-            stdout = "ok"
-            stderr = ""
-        return Result()
-
-    def fake_ensure(namespace: str):
-        venv_dir = tmp_path / "venvs" / namespace
-        (venv_dir / "bin").mkdir(parents=True)
-        (venv_dir / "bin" / "python").write_text("")
-        return venv_dir
-
-    monkeypatch.setattr(deps, "ensure_venv", fake_ensure)
-    monkeypatch.setattr(deps.subprocess, "run", fake_run)
-
+def test_install_packages_calls_subprocess(patched_venv: Path):
     result = deps.install_packages("shared", ["requests==2.32.0"])
     assert result["success"] is True
+    assert result["stdout"] == "ok"
+
+
+def test_output_tail_decodes_only_the_end():
+    data = "ä".encode("utf-8") * 5000 + b"done"
+    tail = deps._output_tail(data, limit=10)
+    assert tail == "ä" * 6 + "done"
 
 
 def test_delete_venv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
@@ -58,17 +67,7 @@ def test_delete_venv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     assert not venv_dir.exists()
 
 
-def test_uninstall_packages_blocks_pip(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
-    monkeypatch.setenv("DATA_DIR", str(tmp_path))
-
-    def fake_ensure(namespace: str):
-        venv_dir = tmp_path / "venvs" / namespace
-        (venv_dir / "bin").mkdir(parents=True)
-        (venv_dir / "bin" / "python").write_text("")
-        return venv_dir
-
-    monkeypatch.setattr(deps, "ensure_venv", fake_ensure)
-
+def test_uninstall_packages_blocks_pip(patched_venv: Path):
     with pytest.raises(ValueError):
         deps.uninstall_packages("shared", ["pip"])
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import threading
 from types import SimpleNamespace
+from typing import Mapping
 from uuid import uuid4
 
 import pytest
@@ -17,6 +19,7 @@ class _StubFastMCPManager:
     def __init__(self):
         self.calls = {}
         self.deleted = None
+        self.delete_thread = None
         self.registry = SimpleNamespace(get_stats=lambda: {"external": 2})
 
     async def list_registry_servers(self, limit=30, cursor=None, search=None):
@@ -125,6 +128,7 @@ class _StubFastMCPManager:
 
     def delete_server(self, server_id):
         self.deleted = server_id
+        self.delete_thread = threading.get_ident()
 
     async def sync_from_db(self):
         self.calls["sync_from_db"] = True
@@ -184,7 +188,7 @@ def cleanup_test_servers(data_dir):
 
 def test_list_fastmcp_registry_servers(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     fastmcp_stub: _StubFastMCPManager,
 ):
     response = web_client.get(
@@ -200,7 +204,7 @@ def test_list_fastmcp_registry_servers(
 
 def test_registry_health(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     fastmcp_stub: _StubFastMCPManager,
 ):
     response = web_client.get("/api/fastmcp/registry/health", headers=auth_headers)
@@ -211,7 +215,7 @@ def test_registry_health(
 
 def test_registry_health_offline(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     monkeypatch: pytest.MonkeyPatch,
 ):
     monkeypatch.setattr(fastmcp_routes, "_fastmcp_manager", _FailingFastMCPManager())
@@ -227,7 +231,7 @@ def test_registry_health_offline(
 
 def test_list_fastmcp_servers_from_db(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
 ):
     init_db()
     unique_namespace = f"demo_ns_{uuid4().hex[:8]}"
@@ -261,7 +265,7 @@ def test_list_fastmcp_servers_from_db(
 
 def test_get_single_server(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
 ):
     init_db()
     unique_namespace = f"test_get_{uuid4().hex[:8]}"
@@ -298,7 +302,7 @@ def test_get_single_server(
 
 def test_get_server_not_found(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
 ):
     init_db()
     response = web_client.get("/api/fastmcp/servers/99999", headers=auth_headers)
@@ -343,7 +347,7 @@ def test_post_requires_auth(
 
 def test_add_fastmcp_server(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     fastmcp_stub: _StubFastMCPManager,
 ):
     response = web_client.post(
@@ -364,7 +368,7 @@ def test_add_fastmcp_server(
 
 def test_add_repo_fastmcp_server(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     fastmcp_stub: _StubFastMCPManager,
 ):
     response = web_client.post(
@@ -389,7 +393,7 @@ def test_add_repo_fastmcp_server(
 
 def test_safety_check_endpoint(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     fastmcp_stub: _StubFastMCPManager,
 ):
     response = web_client.post(
@@ -406,7 +410,7 @@ def test_safety_check_endpoint(
 
 def test_sync_fastmcp_servers(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     fastmcp_stub: _StubFastMCPManager,
 ):
     response = web_client.post("/api/fastmcp/sync", headers=auth_headers)
@@ -422,7 +426,7 @@ def test_sync_fastmcp_servers(
 
 def test_add_manual_server(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
 ):
     init_db()
     unique_namespace = f"manual_{uuid4().hex[:8]}"
@@ -459,7 +463,7 @@ def test_add_manual_server(
 
 def test_add_from_config_server_without_pip_package(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
 ):
     init_db()
     unique_namespace = f"fromcfg_{uuid4().hex[:8]}"
@@ -492,7 +496,7 @@ def test_add_from_config_server_without_pip_package(
 
 def test_add_manual_server_with_config(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     data_dir,
 ):
     init_db()
@@ -527,7 +531,7 @@ def test_add_manual_server_with_config(
 
 def test_add_manual_server_duplicate_namespace(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
 ):
     init_db()
     unique_namespace = f"dup_{uuid4().hex[:8]}"
@@ -569,7 +573,7 @@ def test_add_manual_server_duplicate_namespace(
 
 def test_update_server(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     fastmcp_stub: _StubFastMCPManager,
 ):
     init_db()
@@ -609,7 +613,7 @@ def test_update_server(
 
 def test_update_server_not_found(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
 ):
     init_db()
     response = web_client.put(
@@ -625,7 +629,7 @@ def test_update_server_not_found(
 
 def test_get_config_file(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     data_dir,
 ):
     init_db()
@@ -667,7 +671,7 @@ def test_get_config_file(
 
 def test_get_config_file_empty(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
 ):
     init_db()
     unique_namespace = f"empty_{uuid4().hex[:8]}"
@@ -700,7 +704,7 @@ def test_get_config_file_empty(
 
 def test_update_config_file(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     data_dir,
 ):
     init_db()
@@ -728,12 +732,13 @@ def test_update_config_file(
     )
 
     assert response.status_code == 200
-    assert response.json()["content"] == "# New config\ndebug: true"
+    payload = response.json()
+    assert payload["filename"] == "config.yaml"
+    assert payload["content"] == "# New config\ndebug: true"
 
     # Verify file was written
     config_path = data_dir / "external" / "servers" / unique_namespace / "config.yaml"
-    assert config_path.exists()
-    assert "debug: true" in config_path.read_text()
+    assert config_path.read_text(encoding="utf-8") == "# New config\ndebug: true"
 
     # Cleanup
     with get_db() as db:
@@ -743,7 +748,7 @@ def test_update_config_file(
 
 def test_list_config_files(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     data_dir,
 ):
     init_db()
@@ -791,7 +796,7 @@ def test_list_config_files(
 
 def test_start_fastmcp_server(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     fastmcp_stub: _StubFastMCPManager,
 ):
     response = web_client.post("/api/fastmcp/servers/42/start", headers=auth_headers)
@@ -803,7 +808,7 @@ def test_start_fastmcp_server(
 
 def test_stop_fastmcp_server(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     fastmcp_stub: _StubFastMCPManager,
 ):
     response = web_client.post("/api/fastmcp/servers/42/stop", headers=auth_headers)
@@ -815,7 +820,7 @@ def test_stop_fastmcp_server(
 
 def test_delete_fastmcp_server(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     fastmcp_stub: _StubFastMCPManager,
 ):
     response = web_client.delete("/api/fastmcp/servers/42", headers=auth_headers)
@@ -823,6 +828,8 @@ def test_delete_fastmcp_server(
     assert response.status_code == 200
     assert response.json()["success"] is True
     assert fastmcp_stub.deleted == 42
+    # Runs in a worker thread, not on the request's event loop
+    assert fastmcp_stub.delete_thread != threading.get_ident()
 
 
 # ==================== Error Cases ====================
@@ -830,7 +837,7 @@ def test_delete_fastmcp_server(
 
 def test_fastmcp_requires_manager(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     monkeypatch: pytest.MonkeyPatch,
 ):
     monkeypatch.setattr(fastmcp_routes, "_fastmcp_manager", None)
@@ -841,7 +848,7 @@ def test_fastmcp_requires_manager(
 
 def test_fastmcp_validation_error(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     fastmcp_stub: _StubFastMCPManager,
 ):
     response = web_client.post(
@@ -863,7 +870,7 @@ def test_fastmcp_validation_error(
 
 def test_fastmcp_error_paths(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
     monkeypatch: pytest.MonkeyPatch,
 ):
     monkeypatch.setattr(fastmcp_routes, "_fastmcp_manager", _FailingFastMCPManager())
@@ -890,7 +897,7 @@ def test_fastmcp_error_paths(
 
 def test_manual_server_missing_command(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
 ):
     """Manual server requires a command field."""
     response = web_client.post(
@@ -907,7 +914,7 @@ def test_manual_server_missing_command(
 
 def test_reserved_namespace_rejected(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
 ):
     response = web_client.post(
         "/api/fastmcp/servers/manual",
@@ -927,7 +934,7 @@ def test_reserved_namespace_rejected(
 
 def test_provenance_fields_null_when_absent(
     web_client: SyncASGIClient,
-    auth_headers: dict,
+    auth_headers: Mapping[str, str],
 ):
     """package_type and source_url are null for legacy records."""
     init_db()
@@ -170,6 +170,33 @@ class TestToolUnregistration:
 
         assert not registry.has_namespace("single_tool_ns")
 
+    def test_snapshot_restore(self, registry: ToolRegistry, sample_tool: ToolDefinition):
+        """Test that restore rolls tools and namespaces back to the snapshot."""
+        registry.register(sample_tool, namespace="test_ns")
+        snapshot = registry.snapshot()
+
+        registry.unregister_tool("sample_tool")
+        registry.register(
+            ToolDefinition(
+                name="added_later",
+                description="Added after snapshot",
+                input_model=SampleInput,
+                handler=sample_handler,
+            ),
+            namespace="late_ns",
+        )
+        registry.restore(snapshot)
+
+        assert registry.has_tool("sample_tool")
+        assert registry.get_tool_namespace("sample_tool") == "test_ns"
+        assert not registry.has_tool("added_later")
+        assert not registry.has_namespace("late_ns")
+
+        # Mutating after restore must not leak back into the snapshot
+        registry.register(sample_tool, namespace="other_ns")
+        registry.restore(snapshot)
+        assert registry.list_namespaces() == ["test_ns"]
+
 
 # ==================== Namespace Tests ====================
 
@@ -14,31 +14,34 @@ import httpx
 
 
 async def _run_request(
-    transport: httpx.ASGITransport,
-    base_url: str,
+    client: httpx.AsyncClient,
     method: str,
     url: str,
     kwargs: dict[str, Any],
     timeout_s: float,
 ) -> httpx.Response:
-    async with httpx.AsyncClient(transport=transport, base_url=base_url) as client:
-        with anyio.fail_after(timeout_s):
-            return await client.request(method, url, **kwargs)
+    with anyio.fail_after(timeout_s):
+        return await client.request(method, url, **kwargs)
 
 
 class SyncASGIClient:
-    """Synchronous client interface backed by httpx.AsyncClient + ASGITransport."""
+    """Synchronous client interface backed by httpx.AsyncClient + ASGITransport.
+
+    One AsyncClient is reused for every request; each call still runs in its
+    own short-lived event loop, so no lifespan or background loop is kept.
+    """
 
     def __init__(self, app, base_url: str = "http://test", timeout_s: float = 10.0) -> None:
-        self._transport = httpx.ASGITransport(app=app)
-        self._base_url = base_url
+        self._client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url=base_url,
+        )
         self._timeout_s = timeout_s
 
     def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
         return anyio.run(
             _run_request,
-            self._transport,
-            self._base_url,
+            self._client,
             method,
             url,
             kwargs,
@@ -58,4 +61,5 @@ class SyncASGIClient:
         return self.request("DELETE", url, **kwargs)
 
     def close(self) -> None:
-        return None
+        if not self._client.is_closed:
+            anyio.run(self._client.aclose)